@@ -0,0 +1,384 @@
+"""
+Benchmarks of scimschema - schema loading, import time and validation throughput - reported as JSON so that the
+results of two versions can be compared
+
+E.g.
+python benchmarks/run_benchmarks.py --output before.json
+python benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# benchmark the scimschema of this tree rather than an installed one
+sys.path.insert(0, _root)
+
+import scimschema  # noqa: E402
+from scimschema import core_schemas  # noqa: E402
+from scimschema._model.model import Model  # noqa: E402
+from scimschema._model.schema_response import ScimResponse  # noqa: E402
+
+_examples_dir = os.path.join(_root, "tests", "examples")
+_extension_dir = os.path.join(_root, "tests", "extension")
+_user_schema = "urn:ietf:params:scim:schemas:core:2.0:User"
+_group_schema = "urn:ietf:params:scim:schemas:core:2.0:Group"
+_list_response_schema = "urn:ietf:params:scim:api:messages:2.0:ListResponse"
+
+
+class Benchmark(NamedTuple):
+    """
+    A benchmark - setup is called once (untimed) and returns the function which is timed
+    :param items: the number of items (e.g. resources) processed by a call, to report a throughput
+    :param number: the number of calls per timing - None to pick it so that a timing takes at least 0.2 seconds
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    items: int = 1
+    number: Optional[int] = None
+    params: Dict[str, Any] = {}
+
+
+def _load_example(name: str) -> Dict:
+    with open(os.path.join(_examples_dir, "{}.json".format(name))) as f:
+        return json.load(f)
+
+
+def _user(i: int) -> Dict:
+    return {
+        "schemas": [_user_schema],
+        "id": "2819c223-7f76-453a-919d-{:012d}".format(i),
+        "externalId": "user{}".format(i),
+        "userName": "user{}@example.com".format(i),
+        "name": {"givenName": "Barbara", "familyName": "Jensen{}".format(i)},
+        "displayName": "Barbara Jensen {}".format(i),
+        "active": True,
+        "emails": [
+            {"value": "user{}@example.com".format(i), "type": "work", "primary": True},
+            {"value": "user{}@example.org".format(i), "type": "home"},
+        ],
+        "phoneNumbers": [{"value": "555-555-{:04d}".format(i % 10000), "type": "work"}],
+        "meta": {
+            "resourceType": "User",
+            "created": "2011-08-01T18:29:49.793Z",
+            "lastModified": "2011-08-01T18:29:49.793Z",
+            "location": "https://example.com/v2/Users/{}".format(i),
+            "version": 'W/"f250dd84f0671c3"',
+        },
+    }
+
+
+def _group(members: int) -> Dict:
+    return {
+        "schemas": [_group_schema],
+        "id": "e9e30dba-f08f-4109-8486-d5c6a331660a",
+        "displayName": "Tour Guides",
+        "members": [
+            {
+                "value": "2819c223-7f76-453a-919d-{:012d}".format(i),
+                "$ref": "https://example.com/v2/Users/{}".format(i),
+                "display": "User {}".format(i),
+            }
+            for i in range(members)
+        ],
+    }
+
+
+def _list_response(users: int) -> Dict:
+    return {
+        "schemas": [_list_response_schema],
+        "totalResults": users,
+        "itemsPerPage": users,
+        "startIndex": 1,
+        "Resources": [_user(i) for i in range(users)],
+    }
+
+
+def _time_import() -> Callable[[], Any]:
+    env = dict(os.environ, PYTHONPATH=_root)
+
+    def run() -> None:
+        # a new interpreter each time so that nothing is imported yet - the byte code and schema caches are warm
+        subprocess.run([sys.executable, "-c", "import scimschema"], env=env, check=True)
+
+    return run
+
+
+def _time_interpreter_start() -> Callable[[], Any]:
+    def run() -> None:
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+    return run
+
+
+def _time_model_load(path: str) -> Callable[[], Any]:
+    with open(path) as f:
+        content = f.read()
+
+    def run() -> None:
+        Model.load(io.StringIO(content))
+
+    return run
+
+
+def _time_cached_model_load(path: str) -> Callable[[], Any]:
+    core_schemas._load_model(path, cache=True)
+
+    def run() -> None:
+        core_schemas._load_model(path, cache=True)
+
+    return run
+
+
+def _time_validate(data: Dict, extension: Dict) -> Callable[[], Any]:
+    def run() -> None:
+        try:
+            ScimResponse(
+                data=data,
+                core_schema_definitions=core_schemas.schema,
+                extension_schema_definitions=extension,
+            ).validate()
+        except AssertionError:
+            pass
+
+    return run
+
+
+def _is_valid(data: Dict, extension: Dict) -> bool:
+    try:
+        scimschema.validate(data, extension)
+    except AssertionError:
+        return False
+    return True
+
+
+def _time_validate_many(resources: List[Dict]) -> Callable[[], Any]:
+    def run() -> None:
+        scimschema.validate_many(resources, extension_schema_definitions={})
+
+    return run
+
+
+def _time_validate_stream(content: str, ndjson: bool = False) -> Callable[[], Any]:
+    def run() -> None:
+        for _ in scimschema.validate_stream(
+            io.StringIO(content), extension_schema_definitions={}, ndjson=ndjson
+        ):
+            pass
+
+    return run
+
+
+def get_benchmarks(scale: float = 1.0) -> List[Benchmark]:
+    """
+    :param scale: the factor applied to the size of the synthetic payloads (e.g. 0.1 for a quick run)
+    """
+    extension = scimschema.load_dict_to_schema(_extension_dir)
+    benchmarks = [
+        Benchmark(name="import/interpreter", setup=_time_interpreter_start, number=1),
+        Benchmark(name="import/scimschema", setup=_time_import, number=1),
+    ]
+    for schema_id, file_name in core_schemas._core_schema_files.items():
+        path = os.path.join(os.path.dirname(core_schemas.__file__), file_name)
+        benchmarks.append(
+            Benchmark(
+                name="load/{}".format(schema_id),
+                setup=lambda path=path: _time_model_load(path),
+            )
+        )
+        benchmarks.append(
+            Benchmark(
+                name="load_cached/{}".format(schema_id),
+                setup=lambda path=path: _time_cached_model_load(path),
+            )
+        )
+
+    for example in ("user", "group", "customUser", "huddleUser"):
+        data = _load_example(example)
+        benchmarks.append(
+            Benchmark(
+                name="validate/examples/{}".format(example),
+                setup=lambda data=data: _time_validate(data, extension),
+                params={"valid": _is_valid(data, extension)},
+            )
+        )
+
+    members = max(1, int(100000 * scale))
+    group = _group(members)
+    benchmarks.append(
+        Benchmark(
+            name="validate/group_members",
+            setup=lambda: _time_validate(group, {}),
+            items=members,
+            number=1,
+            params={"members": members, "valid": _is_valid(group, {})},
+        )
+    )
+
+    users = max(1, int(10000 * scale))
+    list_response = _list_response(users)
+    benchmarks.append(
+        Benchmark(
+            name="validate_many/list_response_users",
+            setup=lambda: _time_validate_many(list_response["Resources"]),
+            items=users,
+            number=1,
+            params={"users": users},
+        )
+    )
+    content = json.dumps(list_response)
+    benchmarks.append(
+        Benchmark(
+            name="validate_stream/list_response_users",
+            setup=lambda: _time_validate_stream(content),
+            items=users,
+            number=1,
+            params={"users": users, "bytes": len(content)},
+        )
+    )
+
+    # users with every attribute of the User schema, as generated for load tests
+    generated_users = list(
+        scimschema.generate_resources(
+            [_user_schema], {}, count=users, fan_out=3, optional_ratio=1.0
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            name="validate_many/generated_users",
+            setup=lambda: _time_validate_many(generated_users),
+            items=users,
+            number=1,
+            params={"users": users},
+        )
+    )
+    ndjson = io.StringIO()
+    scimschema.write_ndjson(generated_users, ndjson)
+    ndjson_content = ndjson.getvalue()
+    benchmarks.append(
+        Benchmark(
+            name="validate_stream/generated_ndjson_users",
+            setup=lambda: _time_validate_stream(ndjson_content, ndjson=True),
+            items=users,
+            number=1,
+            params={"users": users, "bytes": len(ndjson_content)},
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            name="generate/users",
+            setup=lambda: lambda: list(
+                scimschema.generate_resources(
+                    [_user_schema], {}, count=users, fan_out=3, optional_ratio=1.0
+                )
+            ),
+            items=users,
+            number=1,
+            params={"users": users},
+        )
+    )
+    return benchmarks
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    """
+    :return: the result of the benchmark - times are in seconds per call, the best (min) being the least noisy
+    """
+    timer = timeit.Timer(benchmark.setup())
+    number = benchmark.number
+    if number is None:
+        number, _ = timer.autorange()
+        number = max(1, number)
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    result = {
+        "name": benchmark.name,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+        "items": benchmark.items,
+        "items_per_second": benchmark.items / min(times),
+    }
+    result.update(benchmark.params)
+    return result
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark], repeat: int, pattern: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    for benchmark in benchmarks:
+        if pattern is None or pattern in benchmark.name:
+            yield run_benchmark(benchmark, repeat)
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return "{:.3g}{}".format(seconds / factor, unit)
+    return "{:.3g}ns".format(seconds / 1e-9)
+
+
+def _report(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> str:
+    line = "{:<80} {:>10}".format(result["name"], _format_time(result["min"]))
+    if baseline is not None:
+        line += " {:>7.2f}x".format(result["min"] / baseline["min"])
+    return line
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per benchmark")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="size factor of synthetic payloads"
+    )
+    parser.add_argument("--filter", help="only run the benchmarks containing this")
+    parser.add_argument(
+        "--compare", help="report the ratio to the results of this JSON file"
+    )
+    args = parser.parse_args(argv)
+
+    baselines: Dict[str, Dict[str, Any]] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baselines = {r["name"]: r for r in json.load(f)["benchmarks"]}
+
+    results = []
+    for result in run_benchmarks(
+        get_benchmarks(scale=args.scale), repeat=args.repeat, pattern=args.filter
+    ):
+        results.append(result)
+        print(_report(result, baselines.get(result["name"])), file=sys.stderr)
+
+    report = {
+        "scimschema": scimschema.__version__,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "repeat": args.repeat,
+        "scale": args.scale,
+        "benchmarks": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,36 @@
 import os
-from typing import Dict
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from scimschema import core_schemas
-from scimschema._model import attribute
+from scimschema._model import attribute, scim_exceptions
+from scimschema._model.aio import validate_resource_async, validate_resources_async
 from scimschema._model.model import Model
-from scimschema._model.schema_response import ScimResponse
+from scimschema._model.mutability import enforce_mutability as _enforce_mutability
+from scimschema._model.parallel import validate_in_parallel
+from scimschema._model.patch import validate_patch_operations
+from scimschema._model.projection import build_projection_plan
+from scimschema._model.registry import SchemaRegistry, validate_resources
+from scimschema._model.schema_response import ScimResponse, get_meta_schemas
+from scimschema._model.stream import validate_stream as _validate_stream
+from scimschema._model.stream import write_ndjson_resources
+from scimschema._model.uniqueness import UniquenessIndex
 from scimschema.core_schemas import load_dict as _load_dict
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 
 def read_version() -> str:
     dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -17,12 +41,264 @@ def read_version() -> str:
 __version__ = read_version()
 
 
-def validate(data: Dict[str, Model], extension_schema_definitions: Dict[str, Model]):
+def validate(
+    data: Dict[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+):
+    """
+    :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+    """
     ScimResponse(
         data=data,
         core_schema_definitions=core_schemas.schema,
         extension_schema_definitions=extension_schema_definitions,
-    ).validate()
+    ).validate(max_errors=max_errors)
+
+
+def get_errors(
+    data: Dict,
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+) -> List[scim_exceptions.ScimError]:
+    """
+    Validate data like validate() but return the errors as a flat list of records (path, code, expected, actual,
+    reference) instead of raising
+    :return: an empty list if the data is valid
+    """
+    try:
+        validate(
+            data=data,
+            extension_schema_definitions=extension_schema_definitions,
+            max_errors=max_errors,
+        )
+    except AssertionError as ae:
+        return scim_exceptions.get_errors(ae)
+    return []
+
+
+def validate_many(
+    resources: Iterable[Dict],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+    uniqueness_index: Optional[UniquenessIndex] = None,
+) -> List[Optional[AssertionError]]:
+    """
+    Validate many resources (e.g. the "Resources" of a ListResponse) without stopping at the first failure
+    :param max_errors: stop validating a resource once this many errors are found in it - default None validates all
+    :param uniqueness_index: also check that the unique attributes (e.g. id or userName) of each resource are not used
+    by a resource validated before with the same UniquenessIndex
+    :return: one entry per resource - None if it is valid, otherwise the AssertionError it failed with
+    """
+    return list(
+        validate_resources(
+            resources=resources,
+            core_schema_definitions=core_schemas.schema,
+            extension_schema_definitions=extension_schema_definitions,
+            max_errors=max_errors,
+            uniqueness_index=uniqueness_index,
+        )
+    )
+
+
+def validate_patch(
+    data: Dict,
+    schemas: List[str],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+):
+    """
+    Validate a PATCH request (PatchOp) - the path of each operation is resolved to the attribute it targets and only the
+    values of the operations are validated, not the whole resource
+    :param schemas: the "schemas" of the resource being patched e.g. ["urn:ietf:params:scim:schemas:core:2.0:Group"]
+    :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+    """
+    core_meta_schemas, extension_meta_schemas = get_meta_schemas(
+        schemas, core_schemas.schema, extension_schema_definitions
+    )
+    validate_patch_operations(
+        data=data,
+        core_meta_schema=core_meta_schemas[0],
+        extension_meta_schemas=extension_meta_schemas,
+        max_errors=max_errors,
+    )
+
+
+def enforce_mutability(
+    data: Dict,
+    extension_schema_definitions: Dict[str, Model],
+    stored: Optional[Dict] = None,
+    strip_read_only: bool = True,
+) -> Dict:
+    """
+    Check a request body (e.g. of a POST or PUT) against the mutability of its attributes - readOnly values are stripped
+    (or, unless strip_read_only, rejected when they differ from the stored resource) and immutable values are rejected
+    when they differ from a value of the stored resource
+    :param stored: the resource as currently stored - None when the resource is being created
+    :return: a copy of the body without its readOnly values (when stripped)
+    """
+    core_meta_schemas, extension_meta_schemas = get_meta_schemas(
+        data.get("schemas"), core_schemas.schema, extension_schema_definitions
+    )
+    return _enforce_mutability(
+        data=data,
+        core_meta_schema=core_meta_schemas[0],
+        extension_meta_schemas=extension_meta_schemas,
+        stored=stored,
+        strip_read_only=strip_read_only,
+    )
+
+
+def project(
+    data: Dict,
+    extension_schema_definitions: Dict[str, Model],
+    attributes: Union[str, Sequence[str], None] = None,
+    excluded_attributes: Union[str, Sequence[str], None] = None,
+) -> Dict:
+    """
+    Select the attributes of a resource to be returned as per their "returned" characteristic and the "attributes" or
+    "excludedAttributes" parameters - use SchemaRegistry.project to reuse the plan across resources
+    :param attributes: the attribute paths to return, as a list or as the comma separated value of the parameter
+    :param excluded_attributes: the attribute paths not to return, as a list or as the comma separated value
+    :return: a copy of the resource holding the attributes to be returned
+    """
+    core_meta_schemas, extension_meta_schemas = get_meta_schemas(
+        data.get("schemas"), core_schemas.schema, extension_schema_definitions
+    )
+    return build_projection_plan(
+        core_meta_schema=core_meta_schemas[0],
+        extension_meta_schemas=extension_meta_schemas,
+        attributes=attributes,
+        excluded_attributes=excluded_attributes,
+    ).apply(data)
+
+
+def validate_parallel(
+    resources: Iterable[Dict],
+    extension_schema_definitions: Dict[str, Model],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[Optional[AssertionError]]:
+    """
+    Same as validate_many but shards the resources in chunks of chunk_size across a pool of max_workers processes
+    :return: one entry per resource, in the order given - None if it is valid, otherwise the AssertionError it failed with
+    """
+    return validate_in_parallel(
+        resources=resources,
+        core_schema_definitions=core_schemas.schema,
+        extension_schema_definitions=extension_schema_definitions,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    )
+
+
+def validate_stream(
+    fp: IO,
+    extension_schema_definitions: Dict[str, Model],
+    ndjson: bool = False,
+    uniqueness_index: Optional[UniquenessIndex] = None,
+) -> Iterator[Tuple[Any, Optional[AssertionError]]]:
+    """
+    Validate the "Resources" of a ListResponse (or the lines of a NDJSON file when ndjson is True) read incrementally
+    from a file object, so that only the resource being validated is held in memory
+    :param uniqueness_index: also check the unique attributes of each resource against the resources validated before
+    :return: an iterator yielding (resource, None) for a valid resource or (resource, AssertionError) otherwise - a
+    NDJSON line which is not valid JSON is yielded as (line, AssertionError) and the next lines are still validated
+    """
+    return _validate_stream(
+        fp=fp,
+        core_schema_definitions=core_schemas.schema,
+        extension_schema_definitions=extension_schema_definitions,
+        ndjson=ndjson,
+        uniqueness_index=uniqueness_index,
+    )
+
+
+def generate_resources(
+    schemas: List[str],
+    extension_schema_definitions: Dict[str, Model],
+    count: int = 1,
+    start: int = 0,
+    seed: int = 0,
+    fan_out: int = 2,
+    fan_out_by_attribute: Optional[Dict[str, int]] = None,
+    optional_ratio: float = 0.5,
+    invalid_ratio: float = 0.0,
+) -> Iterator[Dict]:
+    """
+    Generate synthetic resources of the given schemas (e.g. to load test or benchmark) - the same seed generates the
+    same resources
+    :param schemas: the "schemas" of the resources e.g. ["urn:ietf:params:scim:schemas:core:2.0:User"]
+    :param fan_out: the maximum number of values of a multi-valued attribute (from 1 to fan_out values)
+    :param fan_out_by_attribute: the exact number of values of the named multi-valued attributes e.g. {"members": 1000}
+    :param optional_ratio: the probability of an attribute which is not required to be generated
+    :param invalid_ratio: the probability of a resource to be invalid - an attribute gets a value of the wrong type
+    """
+    # imported here as random and uuid would add to the import time of scimschema
+    from scimschema._model.generator import generate_resources as _generate_resources
+
+    core_meta_schemas, extension_meta_schemas = get_meta_schemas(
+        schemas, core_schemas.schema, extension_schema_definitions
+    )
+    return _generate_resources(
+        core_meta_schema=core_meta_schemas[0],
+        extension_meta_schemas=extension_meta_schemas,
+        count=count,
+        start=start,
+        seed=seed,
+        fan_out=fan_out,
+        fan_out_by_attribute=fan_out_by_attribute,
+        optional_ratio=optional_ratio,
+        invalid_ratio=invalid_ratio,
+    )
+
+
+def write_ndjson(resources: Iterable[Dict], fp: IO) -> int:
+    """
+    Write each resource on a line of its own to a text file object - e.g. to be read by validate_stream(ndjson=True)
+    :return: the number of resources written
+    """
+    return write_ndjson_resources(resources, fp)
+
+
+async def validate_async(
+    data: Dict,
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+    executor: Optional["Executor"] = None,
+) -> None:
+    """
+    Same as validate but runs in an executor (the event loop's default thread pool if None) to keep the event loop free
+    """
+    await validate_resource_async(
+        data=data,
+        core_schema_definitions=core_schemas.schema,
+        extension_schema_definitions=extension_schema_definitions,
+        max_errors=max_errors,
+        executor=executor,
+    )
+
+
+async def validate_many_async(
+    resources: Iterable[Dict],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+    chunk_size: int = 100,
+    executor: Optional["Executor"] = None,
+) -> List[Optional[AssertionError]]:
+    """
+    Same as validate_many but runs in an executor (the event loop's default thread pool if None), chunk_size resources
+    at a time, so that cancelling the awaiting task stops the validation before the next chunk
+    :return: one entry per resource, in the order given - None if it is valid, otherwise the AssertionError it failed with
+    """
+    return await validate_resources_async(
+        resources=resources,
+        core_schema_definitions=core_schemas.schema,
+        extension_schema_definitions=extension_schema_definitions,
+        max_errors=max_errors,
+        chunk_size=chunk_size,
+        executor=executor,
+    )
 
 
 def load_dict_to_schema(path) -> Dict[str, Model]:
@@ -0,0 +1,102 @@
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional
+
+from .model import Model
+from .parallel import _chunks
+from .registry import validate_resources
+from .schema_response import ScimResponse
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+def _validate(
+    data: Dict,
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int],
+) -> None:
+    ScimResponse(
+        data=data,
+        core_schema_definitions=core_schema_definitions,
+        extension_schema_definitions=extension_schema_definitions,
+    ).validate(max_errors=max_errors)
+
+
+def _validate_chunk(
+    resources: List[Dict],
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int],
+) -> List[Optional[AssertionError]]:
+    return list(
+        validate_resources(
+            resources,
+            core_schema_definitions,
+            extension_schema_definitions,
+            max_errors=max_errors,
+        )
+    )
+
+
+async def validate_resource_async(
+    data: Dict,
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+    executor: Optional["Executor"] = None,
+) -> None:
+    """
+    Validate a resource in an executor (the event loop's default thread pool if None) so that the event loop is not
+    blocked - once started, the validation of a resource runs to completion even if the awaiting task is cancelled
+    """
+    # imported here as asyncio would add to the import time of scimschema - it is already loaded when awaited
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(
+        executor,
+        partial(
+            _validate,
+            data,
+            core_schema_definitions,
+            extension_schema_definitions,
+            max_errors,
+        ),
+    )
+
+
+async def validate_resources_async(
+    resources: Iterable[Dict],
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+    chunk_size: int = 100,
+    executor: Optional["Executor"] = None,
+) -> List[Optional[AssertionError]]:
+    """
+    Validate resources in an executor (the event loop's default thread pool if None), chunk_size resources at a time,
+    returning to the event loop between chunks so that cancelling the awaiting task stops before the next chunk
+    :return: one entry per resource, in the order given - None if it is valid, otherwise the AssertionError it failed with
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1 but got {}".format(chunk_size))
+
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    results: List[Optional[AssertionError]] = []
+    for chunk in _chunks(resources, chunk_size):
+        results.extend(
+            await loop.run_in_executor(
+                executor,
+                partial(
+                    _validate_chunk,
+                    chunk,
+                    core_schema_definitions,
+                    extension_schema_definitions,
+                    max_errors,
+                ),
+            )
+        )
+    return results
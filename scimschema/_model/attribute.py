@@ -1,10 +1,97 @@
-import collections
 import re
-from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Type, Union
 
 from . import scim_exceptions
+from .scim_exceptions import ErrorBudget
+
+# ^[a-zA-Z] - starts with ALPHA 0...many
+# (\$|\-|_|\w)$ - ends with $ - _ alphanumeric
+_name_pattern = re.compile(r"^[a-zA-Z](\$|-|_|\w)*$")
+
+# xsd:dateTime (https://www.w3.org/TR/xmlschema11-2/#dateTime) e.g. 2008-01-23T04:56:22Z, 2011-08-01T18:29:49.793Z
+# or 2011-08-01T18:29:49+01:00 - the calendar date itself is checked by _is_datetime
+_datetime_pattern = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})(\.[0-9]+)?"
+    r"(Z|[+-]([0-9]{2}):([0-9]{2}))?"
+)
+
+
+def _is_datetime(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    match = _datetime_pattern.fullmatch(value)
+    if match is None:
+        return False
+    year, month, day, hour, minute, second, _, _, tz_hour, tz_minute = match.groups()
+    # the time zone offset is from -14:00 to +14:00
+    if tz_hour is not None and (
+        int(tz_minute) > 59 or (int(tz_hour), int(tz_minute)) > (14, 0)
+    ):
+        return False
+    # a leap second (60) is valid but not 61 to 99
+    if int(second) > 60:
+        return False
+    try:
+        datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            min(int(second), 59),
+        )
+    except ValueError:
+        return False
+    return True
+
+
+def _is_decimal(value: Any) -> bool:
+    # a bool is not a float, nor is an int or a string such as "10.5"
+    if not (value and isinstance(value, float)):
+        return False
+    pos_period = str(value).find(".")
+    return pos_period >= 1 and len(str(value)) - pos_period >= 1
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Turn a JSON value into an equal hashable value - objects and arrays become tagged tuples
+    """
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return list, tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), repr(value)
+    return value
+
+
+def _is_new_duplicate(seen: Set[Any], reported: Set[Any], key: Any) -> bool:
+    """
+    Add the key of a value of a multi-valued attribute to the keys seen so far
+    :param reported: the keys already seen again
+    :return: True the first time the key is seen again
+    """
+    size = len(seen)
+    try:
+        seen.add(key)
+    except TypeError:
+        key = _freeze(key)
+        seen.add(key)
+    if len(seen) > size or key in reported:
+        return False
+    reported.add(key)
+    return True
+
+
+# compiled validators take the value (or the dictionary holding it) and an optional ErrorBudget
+Validator = Callable[..., None]
+ValueValidator = Callable[..., None]
+# normalises a value of a multi-valued attribute into the key comparing it to the other values - None if not compared
+UniquenessKey = Callable[[Any], Any]
 
 
 class Attribute:
@@ -42,6 +129,25 @@ class Attribute:
         self.uniqueness = d.pop("uniqueness", "none")
         self.multiValued = d.pop("multiValued", False)  # todo confirm default is False?
         self._d = d
+        self._canonical_values = self._get_canonical_values()
+        self._value_validator: Optional[ValueValidator] = None
+
+    def __getstate__(self) -> Dict:
+        # the value validator is a closure - rebuild it on first use after unpickling
+        state = self.__dict__.copy()
+        state["_value_validator"] = None
+        return state
+
+    def _get_canonical_values(self) -> Optional[FrozenSet[Any]]:
+        """
+        :return: the canonical values as a set to look values up in - lower-cased unless caseExact is True
+        """
+        if not (self.canonicalValues and isinstance(self.canonicalValues, list)):
+            return None
+        return frozenset(
+            cv if self.caseExact or not isinstance(cv, str) else cv.lower()
+            for cv in self.canonicalValues
+        )
 
     # https://tools.ietf.org/html/rfc7643#section-7
     # <editor-fold desc="validate meta attribute methods">
@@ -58,11 +164,7 @@ class Attribute:
 
     def _validate_schema_name(self) -> None:
         msg = 'valid name e.g. must be ALPHA * {{nameChar}} where nameChar   = "$" / "-" / "_" / DIGIT / ALPHA'
-        # ^[a-zA-Z] - starts with ALPHA 0...many
-        # (\$|\-|_|\w)$ - ends with $ - _ alphanumeric
-        if self.name is None or not bool(
-            re.match(r"^[a-zA-Z](\$|-|_|\w)*$", self.name)
-        ):
+        if self.name is None or not bool(_name_pattern.match(self.name)):
             raise scim_exceptions.ModelAttributeCharacteristicNotAllowedException(
                 locator_path=self._locator_path,
                 attribute_name="name",
@@ -183,13 +285,34 @@ class Attribute:
     def _get_significant_value(d: Dict) -> Dict:
         return d
 
+    def _get_uniqueness_key(self) -> Optional[UniquenessKey]:
+        """
+        :return: the function keying a value as itself - lower-cased unless caseExact
+        """
+        if self.caseExact:
+
+            def get_exact_key(v: Any) -> Any:
+                return v
+
+            return get_exact_key
+
+        def get_key(v: Any) -> Any:
+            return v.lower() if isinstance(v, str) else v
+
+        return get_key
+
+    def _value_not_found(
+        self, d: Dict
+    ) -> scim_exceptions.ScimAttributeValueNotFoundException:
+        return scim_exceptions.ScimAttributeValueNotFoundException(
+            d, self._locator_path, self.name, self.multiValued
+        )
+
     def _get_value(self, d: Dict) -> str:
         try:
-            return d.pop(self.name)
+            return d[self.name]
         except KeyError:
-            raise scim_exceptions.ScimAttributeValueNotFoundException(
-                d, self._locator_path, self.name, self.multiValued
-            )
+            raise self._value_not_found(d)
 
     def _validate(self, value: Any):
         raise NotImplementedError(
@@ -197,8 +320,13 @@ class Attribute:
         )
 
     def validate(self, d):
+        if self.name not in d:
+            if self.required:
+                raise self._value_not_found(d)
+            return
+
         try:
-            value = self._get_value(deepcopy(d))
+            value = self._get_value(d)
             self._validate(value)
 
         except scim_exceptions.ScimAttributeValueNotFoundException:
@@ -209,6 +337,52 @@ class Attribute:
         except scim_exceptions.ScimAttributeInvalidTypeException:
             raise
 
+    def _compile_value(self) -> ValueValidator:
+        """
+        Build the check applied to the value of this attribute once it has been found.
+        Subclasses override this with a specialised closure; by default the value is checked by _validate
+        """
+        validate = self._validate
+
+        def validate_value(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            validate(value)
+
+        return validate_value
+
+    def _get_value_validator(self) -> ValueValidator:
+        """
+        :return: the check applied to the value of this attribute, built once by _compile_value
+        """
+        if self._value_validator is None:
+            self._value_validator = self._compile_value()
+        return self._value_validator
+
+    def compile(self) -> Validator:
+        """
+        Build a closure equivalent to validate(d) which looks the value up instead of copying and popping it
+        :return: a callable taking the dictionary which holds this attribute
+        """
+        name = self.name
+        value_not_found = self._value_not_found
+        validate_value = self._compile_value()
+
+        if self.required:
+
+            def validate_required(
+                d: Dict, budget: Optional[ErrorBudget] = None
+            ) -> None:
+                if name not in d:
+                    raise value_not_found(d)
+                validate_value(d[name], budget)
+
+            return validate_required
+
+        def validate_optional(d: Dict, budget: Optional[ErrorBudget] = None) -> None:
+            if name in d:
+                validate_value(d[name], budget)
+
+        return validate_optional
+
 
 class BinaryAttribute(Attribute):
     _link_reference = "https://tools.ietf.org/html/rfc7643#section-2.3.6"
@@ -226,6 +400,15 @@ class BinaryAttribute(Attribute):
                 attribute_type="binary",
             )
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        def validate_binary(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            if not isinstance(value, str):
+                validate(value)
+
+        return validate_binary
+
 
 class BooleanAttribute(Attribute):
 
@@ -244,6 +427,15 @@ class BooleanAttribute(Attribute):
             )
             # raise ValueError("{}-{} value: {} must be type boolean".format(self.id, self._locator_path, value))
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        def validate_boolean(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            if not isinstance(value, bool):
+                validate(value)
+
+        return validate_boolean
+
 
 class DatetimeAttribute(Attribute):
 
@@ -252,9 +444,7 @@ class DatetimeAttribute(Attribute):
     _accepted_uniqueness_value = {"none"}
 
     def _validate(self, value: Any) -> None:
-        try:
-            datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-        except ValueError:
+        if not _is_datetime(value):
             raise scim_exceptions.ScimAttributeInvalidTypeException(
                 expected=self._d,
                 locator=self._locator_path,
@@ -264,6 +454,15 @@ class DatetimeAttribute(Attribute):
                 reference=self._link_reference,
             )
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        def validate_datetime(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            if not _is_datetime(value):
+                validate(value)
+
+        return validate_datetime
+
 
 class DecimalAttribute(Attribute):
 
@@ -271,13 +470,7 @@ class DecimalAttribute(Attribute):
     _accepted_case_exact_value = {False}
 
     def _validate(self, value: Any) -> None:
-        pos_period = str(value).index(".")
-        if not (
-            value
-            and isinstance(value, float)
-            and pos_period >= 1
-            and len(str(value)) - pos_period >= 1
-        ):
+        if not _is_decimal(value):
             type_description = "must be a real number with at least one digit to the left and right of the period"
             raise scim_exceptions.ScimAttributeInvalidTypeException(
                 expected=self._d,
@@ -288,6 +481,15 @@ class DecimalAttribute(Attribute):
                 reference=self._link_reference,
             )
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        def validate_decimal(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            if not _is_decimal(value):
+                validate(value)
+
+        return validate_decimal
+
 
 class IntegerAttribute(Attribute):
 
@@ -305,6 +507,15 @@ class IntegerAttribute(Attribute):
             )
             # raise ValueError("{}-{} value: {} must be an integer".format(self.id, self._locator_path, value))
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        def validate_integer(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            if isinstance(value, bool) or not isinstance(value, int):
+                validate(value)
+
+        return validate_integer
+
 
 class ReferenceAttribute(Attribute):
 
@@ -342,6 +553,17 @@ class ReferenceAttribute(Attribute):
                 attribute_type="type reference",
             )
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        def validate_reference(
+            value: Any, budget: Optional[ErrorBudget] = None
+        ) -> None:
+            if not isinstance(value, str):
+                validate(value)
+
+        return validate_reference
+
 
 class StringAttribute(Attribute):
 
@@ -357,14 +579,14 @@ class StringAttribute(Attribute):
                 attribute_type="type string",
             )
 
-        if self.canonicalValues:
+        if self._canonical_values is not None:
             adjusted_value = value if self.caseExact else value.lower()
-            adjusted_canonical_value = (
-                self.canonicalValues
-                if self.caseExact
-                else [cv.lower() for cv in self.canonicalValues]
-            )
-            if not (adjusted_value in adjusted_canonical_value):
+            if not (adjusted_value in self._canonical_values):
+                adjusted_canonical_value = (
+                    self.canonicalValues
+                    if self.caseExact
+                    else [cv.lower() for cv in self.canonicalValues]
+                )
                 raise scim_exceptions.ScimAttributeInvalidTypeException(
                     expected=self._d,
                     locator=self._locator_path,
@@ -375,6 +597,33 @@ class StringAttribute(Attribute):
                     ),
                 )
 
+    def _compile_value(self) -> ValueValidator:
+        validate = self._validate
+
+        canonical_values = self._canonical_values
+        if canonical_values is None:
+
+            def validate_string(
+                value: Any, budget: Optional[ErrorBudget] = None
+            ) -> None:
+                if not isinstance(value, str):
+                    validate(value)
+
+            return validate_string
+
+        case_exact = self.caseExact
+
+        def validate_canonical_string(
+            value: Any, budget: Optional[ErrorBudget] = None
+        ) -> None:
+            if not (
+                isinstance(value, str)
+                and (value if case_exact else value.lower()) in canonical_values
+            ):
+                validate(value)
+
+        return validate_canonical_string
+
 
 class ComplexAttribute(Attribute):
 
@@ -401,12 +650,67 @@ class ComplexAttribute(Attribute):
         ]
 
     def _get_significant_value(self, d):
-        try:
-            return d.get("value")
-        except KeyError:
-            raise scim_exceptions.ScimAttributeValueNotFoundException(
-                d, self._locator_path, self.name, self.multiValued
-            )
+        # the whole value when it has no "value" sub-attribute identifying it
+        return d.get("value", d)
+
+    def _get_primary_name(self) -> Optional[str]:
+        """
+        :return: the name of the "primary" sub-attribute or None if there is none
+        """
+        for sa in self.subAttributes:
+            if isinstance(sa.name, str) and sa.name.lower() == "primary":
+                return sa.name
+        return None
+
+    def _get_uniqueness_key(self) -> Optional[UniquenessKey]:
+        """
+        :return: the function keying a value by its "value" and "type" sub-attributes (lower-cased unless caseExact) or,
+        when it has no "value" sub-attribute, by the whole value
+        """
+        sub_attributes = {
+            sa.name.lower(): sa for sa in self.subAttributes if isinstance(sa.name, str)
+        }
+        value_attribute = sub_attributes.get("value")
+        type_attribute = sub_attributes.get("type")
+
+        if value_attribute is None:
+
+            def get_element_key(v: Any) -> Any:
+                return _freeze(v) if isinstance(v, dict) else None
+
+            return get_element_key
+
+        value_name = value_attribute.name
+        fold_value = not value_attribute.caseExact
+        if type_attribute is None:
+
+            def get_value_key(v: Any) -> Any:
+                if not isinstance(v, dict):
+                    return None
+                value = v.get(value_name)
+                if fold_value and isinstance(value, str):
+                    return value.lower()
+                return value
+
+            return get_value_key
+
+        type_name = type_attribute.name
+        fold_type = not type_attribute.caseExact
+
+        def get_value_type_key(v: Any) -> Any:
+            if not isinstance(v, dict):
+                return None
+            value = v.get(value_name)
+            if value is None:
+                return None
+            if fold_value and isinstance(value, str):
+                value = value.lower()
+            value_type = v.get(type_name)
+            if fold_type and isinstance(value_type, str):
+                value_type = value_type.lower()
+            return value, value_type
+
+        return get_value_type_key
 
     def validate_schema(self) -> None:
         if self._is_parent_complex:
@@ -432,8 +736,17 @@ class ComplexAttribute(Attribute):
             )
 
     def _validate(self, value) -> None:
-        exceptions: List[BaseException] = []
+        if not isinstance(value, dict):
+            raise scim_exceptions.ScimAttributeInvalidTypeException(
+                expected=self._d,
+                locator=self._locator_path,
+                value=value,
+                multi_value=self.multiValued,
+                attribute_type="complex",
+                reference=self._link_reference,
+            )
 
+        exceptions: List[BaseException] = []
         for sa in self.subAttributes:
             try:
                 sa.validate(value)
@@ -447,6 +760,37 @@ class ComplexAttribute(Attribute):
                 self._locator_path, exceptions=exceptions
             )
 
+    def _compile_value(self) -> ValueValidator:
+        locator_path = self._locator_path
+        sub_attribute_validators = [sa.compile() for sa in self.subAttributes]
+
+        def validate_complex(value: Any, budget: Optional[ErrorBudget] = None) -> None:
+            if not isinstance(value, dict):
+                raise scim_exceptions.ScimAttributeInvalidTypeException(
+                    expected=self._d,
+                    locator=locator_path,
+                    value=value,
+                    multi_value=self.multiValued,
+                    attribute_type="complex",
+                    reference=self._link_reference,
+                )
+
+            exceptions: List[BaseException] = []
+            for validate in sub_attribute_validators:
+                try:
+                    validate(value, budget)
+                except Exception as e:
+                    exceptions.append(e)
+                    if budget is not None and budget.spend(e):
+                        break
+
+            if len(exceptions) > 0:
+                raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                    locator_path, exceptions=exceptions
+                )
+
+        return validate_complex
+
 
 class MultiValuedAttribute(Attribute):
 
@@ -495,6 +839,11 @@ class MultiValuedAttribute(Attribute):
     def _get_value(self, d):
         return self.element_attribute._get_value(d)
 
+    def _value_not_found(
+        self, d: Dict
+    ) -> scim_exceptions.ScimAttributeValueNotFoundException:
+        return self.element_attribute._value_not_found(d)
+
     def _validate_schema_type(self) -> None:
         if not isinstance(self.type, str):
             raise scim_exceptions.ModelAttributeCharacteristicNotAllowedException(
@@ -534,17 +883,53 @@ class MultiValuedAttribute(Attribute):
     def validate_schema(self) -> None:
         self.element_attribute.validate_schema()
 
-    def _validate_uniqueness(self, list_values: List[Any]) -> None:
-        if self.uniqueness and self.uniqueness != "none":
-            difference_values = [
-                item
-                for item, count in collections.Counter(list_values).items()
-                if count > 1
-            ]
-            if len(set(difference_values)) > 0:
-                raise scim_exceptions.ScimAttributeDuplicateValueException(
-                    locator=self._locator_path, value=difference_values
-                )
+    def _get_uniqueness_key(self) -> Optional[UniquenessKey]:
+        """
+        :return: the function keying the values which must be unique amongst the values or None if they need not be
+        """
+        if not self.uniqueness or self.uniqueness == "none":
+            return None
+        return self.element_attribute._get_uniqueness_key()
+
+    def _validate_uniqueness(self, values: List[Any]) -> None:
+        get_key = self._get_uniqueness_key()
+        if get_key is None:
+            return
+        get_significant_value = self.element_attribute._get_significant_value
+        seen: Set[Any] = set()
+        reported: Set[Any] = set()
+        duplicates = []
+        for v in values:
+            key = get_key(v)
+            if key is not None and _is_new_duplicate(seen, reported, key):
+                duplicates.append(get_significant_value(v))
+        if len(duplicates) > 0:
+            raise scim_exceptions.ScimAttributeDuplicateValueException(
+                locator=self._locator_path, value=duplicates
+            )
+
+    def _get_primary_name(self) -> Optional[str]:
+        """
+        :return: the name of the "primary" sub-attribute of the values or None if they have none
+        """
+        if isinstance(self.element_attribute, ComplexAttribute):
+            return self.element_attribute._get_primary_name()
+        return None
+
+    def _validate_primary(self, values: List[Any]) -> None:
+        primary_name = self._get_primary_name()
+        if primary_name is None:
+            return
+        get_significant_value = self.element_attribute._get_significant_value
+        primaries = [
+            get_significant_value(v)
+            for v in values
+            if isinstance(v, dict) and v.get(primary_name) is True
+        ]
+        if len(primaries) > 1:
+            raise scim_exceptions.ScimAttributeInvalidPrimaryPropertyException(
+                locator=self._locator_path, value=primaries
+            )
 
     def _validate(self, value: List) -> None:
         if not isinstance(value, list):
@@ -552,11 +937,7 @@ class MultiValuedAttribute(Attribute):
                 self._d, self._locator_path, value, self.multiValued, "list"
             )
 
-        adjusted_values = [
-            self.element_attribute._get_significant_value(v)
-            for v in value
-            if (not v == {} and v is not None)
-        ]
+        adjusted_values = [v for v in value if (not v == {} and v is not None)]
         if len(adjusted_values) == 0:
             raise scim_exceptions.ScimAttributeValueNotFoundException(
                 value, self._locator_path, self.name, self.multiValued
@@ -564,16 +945,19 @@ class MultiValuedAttribute(Attribute):
 
         exceptions = []
         try:
-            self._validate_uniqueness(list_values=adjusted_values)
+            self._validate_uniqueness(adjusted_values)
         except AssertionError as dpp:
             exceptions.append(dpp)
+        try:
+            self._validate_primary(adjusted_values)
+        except AssertionError as ipp:
+            exceptions.append(ipp)
 
-        for v in value:
-            if not v == {} and v is not None:
-                try:
-                    self.element_attribute._validate(v)
-                except AssertionError as iat:
-                    exceptions.append(iat)
+        for v in adjusted_values:
+            try:
+                self.element_attribute._validate(v)
+            except AssertionError as iat:
+                exceptions.append(iat)
 
         if len(exceptions) > 0:
             raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
@@ -581,6 +965,87 @@ class MultiValuedAttribute(Attribute):
                 exceptions=exceptions,
             )
 
+    def _compile_value(self) -> ValueValidator:
+        validate_element = self.element_attribute._compile_value()
+        get_significant_value = self.element_attribute._get_significant_value
+        get_key = self._get_uniqueness_key()
+        primary_name = self._get_primary_name()
+        required = self.required
+        locator_path = self._locator_path
+        location = "{} at path ('{}')".format(self.name, locator_path)
+
+        def validate_multi_valued(
+            value: Any, budget: Optional[ErrorBudget] = None
+        ) -> None:
+            if not isinstance(value, list):
+                raise scim_exceptions.ScimAttributeInvalidTypeException(
+                    self._d, locator_path, value, self.multiValued, "list"
+                )
+
+            # a single pass over the values validates them, keys them to find duplicates and counts the primary ones
+            # - duplicates then primaries are reported first, ahead of the errors of the values
+            exceptions = []
+            found = False
+            seen: Set[Any] = set()
+            reported: Set[Any] = set()
+            duplicates: List[Any] = []
+            duplicate_exception = None
+            primaries: List[Any] = []
+            primary_exception = None
+            for v in value:
+                if v is None or v == {}:
+                    continue
+                found = True
+                if get_key is not None:
+                    key = get_key(v)
+                    if key is not None and _is_new_duplicate(seen, reported, key):
+                        duplicates.append(get_significant_value(v))
+                        if duplicate_exception is None:
+                            # later duplicates are added to the values of the exception
+                            duplicate_exception = (
+                                scim_exceptions.ScimAttributeDuplicateValueException(
+                                    locator=locator_path, value=duplicates
+                                )
+                            )
+                            if budget is not None and budget.spend(duplicate_exception):
+                                break
+                if (
+                    primary_name is not None
+                    and isinstance(v, dict)
+                    and v.get(primary_name) is True
+                ):
+                    primaries.append(get_significant_value(v))
+                    if len(primaries) > 1 and primary_exception is None:
+                        # later primary values are added to the values of the exception
+                        primary_exception = scim_exceptions.ScimAttributeInvalidPrimaryPropertyException(
+                            locator=locator_path, value=primaries
+                        )
+                        if budget is not None and budget.spend(primary_exception):
+                            break
+                try:
+                    validate_element(v, budget)
+                except AssertionError as iat:
+                    exceptions.append(iat)
+                    if budget is not None and budget.spend(iat):
+                        break
+
+            if not found:
+                if not required:
+                    return
+                raise scim_exceptions.ScimAttributeValueNotFoundException(
+                    value, locator_path, self.name, self.multiValued
+                )
+            if primary_exception is not None:
+                exceptions.insert(0, primary_exception)
+            if duplicate_exception is not None:
+                exceptions.insert(0, duplicate_exception)
+            if len(exceptions) > 0:
+                raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                    location=location, exceptions=exceptions
+                )
+
+        return validate_multi_valued
+
 
 attribute_factory: Dict[str, Type[Attribute]] = {
     "binary": BinaryAttribute,
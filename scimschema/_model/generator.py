@@ -0,0 +1,235 @@
+import random
+import uuid
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+
+from .attribute import (
+    Attribute,
+    BinaryAttribute,
+    BooleanAttribute,
+    ComplexAttribute,
+    DatetimeAttribute,
+    DecimalAttribute,
+    IntegerAttribute,
+    MultiValuedAttribute,
+    ReferenceAttribute,
+)
+from .model import Model
+
+# a value of the wrong type for each type of attribute - the string and reference attributes get an integer
+_invalid_values: Dict[type, Any] = {
+    BinaryAttribute: 1024,
+    BooleanAttribute: "true",
+    ComplexAttribute: "not a complex value",
+    DatetimeAttribute: "01/08/2011 18:29:49",
+    DecimalAttribute: "10.5",
+    IntegerAttribute: "10",
+    MultiValuedAttribute: "not a list",
+}
+
+
+class ResourceGenerator:
+    """
+    Generate synthetic resources of a core schema (and its extensions) by walking the attributes of their models - each
+    resource only depends on the seed and its index, so the same resources are generated from one run to the next
+    :param fan_out: the maximum number of values of a multi-valued attribute (from 1 to fan_out values)
+    :param fan_out_by_attribute: the exact number of values of the named multi-valued attributes e.g. {"members": 1000}
+    :param optional_ratio: the probability of an attribute which is not required to be generated
+    :param invalid_ratio: the probability of a resource to be invalid - an attribute gets a value of the wrong type
+    """
+
+    def __init__(
+        self,
+        core_meta_schema: Model,
+        extension_meta_schemas: Sequence[Model] = (),
+        seed: int = 0,
+        fan_out: int = 2,
+        fan_out_by_attribute: Optional[Mapping[str, int]] = None,
+        optional_ratio: float = 0.5,
+        invalid_ratio: float = 0.0,
+    ):
+        if fan_out < 1:
+            raise ValueError("fan_out must be at least 1 but got {}".format(fan_out))
+        for ratio_name, ratio in (
+            ("optional_ratio", optional_ratio),
+            ("invalid_ratio", invalid_ratio),
+        ):
+            if not 0.0 <= ratio <= 1.0:
+                raise ValueError(
+                    "{} must be between 0 and 1 but got {}".format(ratio_name, ratio)
+                )
+        self.core_meta_schema = core_meta_schema
+        self.extension_meta_schemas = list(extension_meta_schemas)
+        self.seed = seed
+        self.fan_out = fan_out
+        self.fan_out_by_attribute = {
+            name.lower(): count for name, count in (fan_out_by_attribute or {}).items()
+        }
+        self.optional_ratio = optional_ratio
+        self.invalid_ratio = invalid_ratio
+
+    def _generate_simple(
+        self, attribute: Attribute, rng: random.Random, label: str
+    ) -> Any:
+        if isinstance(attribute, BooleanAttribute):
+            return rng.random() < 0.5
+        if isinstance(attribute, IntegerAttribute):
+            return rng.randint(0, 10000)
+        if isinstance(attribute, DecimalAttribute):
+            return round(rng.uniform(1, 10000), 2)
+        if isinstance(attribute, DatetimeAttribute):
+            return "20{:02d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(
+                rng.randint(0, 30),
+                rng.randint(1, 12),
+                rng.randint(1, 28),
+                rng.randint(0, 23),
+                rng.randint(0, 59),
+                rng.randint(0, 59),
+            )
+        if isinstance(attribute, BinaryAttribute):
+            return "{:032x}".format(rng.getrandbits(128))
+        if isinstance(attribute, ReferenceAttribute):
+            return "https://example.com/v2/{}".format(label)
+        if attribute.canonicalValues:
+            return rng.choice(attribute.canonicalValues)
+        # the label makes the values unique within the resource and across resources
+        return "{}-{:04x}".format(label, rng.getrandbits(16))
+
+    def _generate_complex(
+        self,
+        attribute: ComplexAttribute,
+        rng: random.Random,
+        label: str,
+        primary: bool,
+    ) -> Dict:
+        value = {}
+        sub_attributes = [
+            sa
+            for sa in attribute.subAttributes
+            if sa.returned != "never" and isinstance(sa.name, str)
+        ]
+        for sa in sub_attributes:
+            if sa.name.lower() == "primary":
+                # at most one value of a multi-valued attribute is primary
+                if primary:
+                    value[sa.name] = True
+            elif sa.required or rng.random() < self.optional_ratio:
+                value[sa.name] = self._generate_value(
+                    sa, rng, "{}.{}".format(label, sa.name)
+                )
+        if not value and sub_attributes:
+            # an empty complex value is ignored, as if the attribute had no value
+            sa = sub_attributes[0]
+            value[sa.name] = self._generate_value(
+                sa, rng, "{}.{}".format(label, sa.name)
+            )
+        return value
+
+    def _generate_value(
+        self, attribute: Attribute, rng: random.Random, label: str
+    ) -> Any:
+        if isinstance(attribute, MultiValuedAttribute):
+            count = self.fan_out_by_attribute.get(attribute.name.lower())
+            if count is None:
+                count = rng.randint(1, self.fan_out)
+            element = attribute.element_attribute
+            if isinstance(element, ComplexAttribute):
+                return [
+                    self._generate_complex(
+                        element, rng, "{}-{}".format(label, i), primary=i == 0
+                    )
+                    for i in range(count)
+                ]
+            return [
+                self._generate_simple(element, rng, "{}-{}".format(label, i))
+                for i in range(count)
+            ]
+        if isinstance(attribute, ComplexAttribute):
+            return self._generate_complex(attribute, rng, label, primary=False)
+        return self._generate_simple(attribute, rng, label)
+
+    def _generate_attributes(
+        self, model: Model, rng: random.Random, index: int
+    ) -> Dict[str, Any]:
+        data = {}
+        for attribute in model.attributes:
+            if attribute.returned == "never" or not isinstance(attribute.name, str):
+                continue
+            if attribute.required or rng.random() < self.optional_ratio:
+                data[attribute.name] = self._generate_value(
+                    attribute, rng, "{}{}".format(attribute.name, index)
+                )
+        return data
+
+    def generate(self, index: int) -> Dict:
+        """
+        :return: the resource at this index
+        """
+        rng = random.Random("{}:{}".format(self.seed, index))
+        resource_type = self.core_meta_schema.name or "Resource"
+        resource_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        resource: Dict[str, Any] = {
+            "schemas": [self.core_meta_schema.id]
+            + [extension.id for extension in self.extension_meta_schemas],
+            "id": resource_id,
+            "externalId": "{}{}".format(resource_type.lower(), index),
+            "meta": {
+                "resourceType": resource_type,
+                "created": "2011-08-01T18:29:49.793Z",
+                "lastModified": "2011-08-01T18:29:49.793Z",
+                "location": "https://example.com/v2/{}s/{}".format(
+                    resource_type, resource_id
+                ),
+                "version": 'W/"{:016x}"'.format(rng.getrandbits(64)),
+            },
+        }
+        resource.update(self._generate_attributes(self.core_meta_schema, rng, index))
+        for extension in self.extension_meta_schemas:
+            resource[extension.id] = self._generate_attributes(extension, rng, index)
+
+        if rng.random() < self.invalid_ratio:
+            self._invalidate(resource, rng)
+        return resource
+
+    def _invalidate(self, resource: Dict, rng: random.Random) -> None:
+        attributes: List[Attribute] = [
+            attribute
+            for attribute in self.core_meta_schema.attributes
+            if attribute.returned != "never" and isinstance(attribute.name, str)
+        ]
+        if len(attributes) == 0:
+            resource["schemas"] = []
+            return
+        attribute = rng.choice(attributes)
+        resource[attribute.name] = _invalid_values.get(type(attribute), 0)
+
+    def __iter__(self) -> Iterator[Dict]:
+        index = 0
+        while True:
+            yield self.generate(index)
+            index += 1
+
+
+def generate_resources(
+    core_meta_schema: Model,
+    extension_meta_schemas: Sequence[Model] = (),
+    count: int = 1,
+    start: int = 0,
+    seed: int = 0,
+    fan_out: int = 2,
+    fan_out_by_attribute: Optional[Mapping[str, int]] = None,
+    optional_ratio: float = 0.5,
+    invalid_ratio: float = 0.0,
+) -> Iterator[Dict]:
+    """
+    Generate count synthetic resources from the index start - see ResourceGenerator for the other parameters
+    """
+    generator = ResourceGenerator(
+        core_meta_schema,
+        extension_meta_schemas,
+        seed=seed,
+        fan_out=fan_out,
+        fan_out_by_attribute=fan_out_by_attribute,
+        optional_ratio=optional_ratio,
+        invalid_ratio=invalid_ratio,
+    )
+    return (generator.generate(index) for index in range(start, start + count))
@@ -1,10 +1,44 @@
 import json
 import re
-from copy import deepcopy
-from typing import Dict, List, Optional, TextIO
+from typing import Callable, Dict, List, NamedTuple, Optional, TextIO
 
 from . import scim_exceptions
-from .attribute import Attribute, AttributeFactory
+from .attribute import (
+    Attribute,
+    AttributeFactory,
+    ComplexAttribute,
+    MultiValuedAttribute,
+)
+from .scim_exceptions import ErrorBudget
+
+_name_pattern = re.compile(r"^[a-zA-Z]*([a-zA-Z]|\s)*(\$|-|_|\w)$")
+_service_provider_name_pattern = re.compile(r"^[\w]*(\$|\-|_|\d|\w)$")
+
+
+class MutabilityRule(NamedTuple):
+    """
+    An attribute (or sub-attribute) which is not readWrite - https://tools.ietf.org/html/rfc7643#section-2.2
+    """
+
+    name: str
+    sub_name: Optional[str]
+    mutability: str
+    multi_valued: bool
+    case_exact: bool
+
+
+class UniqueAttribute(NamedTuple):
+    """
+    A single-valued simple attribute which must be unique across the resources - https://tools.ietf.org/html/rfc7643#section-2.1
+    """
+
+    name: str
+    uniqueness: str
+    case_exact: bool
+
+
+# the mutabilities restricting what a request may write - writeOnly attributes are only restricted from being returned
+_restricted_mutabilities = frozenset(["readOnly", "immutable"])
 
 
 class Model(object):
@@ -15,6 +49,7 @@ class Model(object):
 
     def __init__(self, schema_data: Dict):
 
+        self._validator: Optional[Callable[..., None]] = None
         self.id = schema_data.pop("id", "")
         self.external_id = schema_data.pop("externalId", None)
         self.meta = schema_data.pop("meta", None)
@@ -33,6 +68,20 @@ class Model(object):
                 for d in attributes
             ]
 
+        self._attribute_index = self._build_attribute_index()
+        self._mutability_rules = self._build_mutability_rules()
+        self._unique_attributes = [
+            UniqueAttribute(
+                name=attribute.name,
+                uniqueness=attribute.uniqueness,
+                case_exact=bool(attribute.caseExact),
+            )
+            for attribute in self.attributes
+            if attribute.uniqueness in ("server", "global")
+            and isinstance(attribute.name, str)
+            and not isinstance(attribute, (MultiValuedAttribute, ComplexAttribute))
+        ]
+
         exceptions = []
         try:
             self.validate_schema()
@@ -50,9 +99,127 @@ class Model(object):
                 location=self.id, exceptions=exceptions
             )
 
+    def __getstate__(self) -> Dict:
+        # the compiled validator is a closure - rebuild it on first use after unpickling
+        state = self.__dict__.copy()
+        state["_validator"] = None
+        return state
+
+    def _build_attribute_index(self) -> Dict[str, Attribute]:
+        """
+        Index the attributes and sub-attributes by their lower-cased path, both short (e.g. name.givenname) and
+        qualified by the schema URN (e.g. urn:ietf:params:scim:schemas:core:2.0:user:name.givenname)
+        """
+        index: Dict[str, Attribute] = {}
+        for attribute in self.attributes:
+            if not isinstance(attribute.name, str):
+                continue
+            name = attribute.name.lower()
+            index.setdefault(name, attribute)
+            if isinstance(attribute, MultiValuedAttribute):
+                attribute = attribute.element_attribute
+            if isinstance(attribute, ComplexAttribute):
+                for sub_attribute in attribute.subAttributes:
+                    if isinstance(sub_attribute.name, str):
+                        index.setdefault(
+                            "{}.{}".format(name, sub_attribute.name.lower()),
+                            sub_attribute,
+                        )
+        if self.id:
+            prefix = self.id.lower() + ":"
+            index.update([(prefix + path, a) for path, a in list(index.items())])
+        return index
+
+    def _build_mutability_rules(self) -> List[MutabilityRule]:
+        """
+        List the attributes and sub-attributes which are readOnly or immutable - the sub-attributes of such an attribute
+        are covered by the attribute itself so they are not listed
+        """
+        rules = []
+        for attribute in self.attributes:
+            if not isinstance(attribute.name, str):
+                continue
+            multi_valued = isinstance(attribute, MultiValuedAttribute)
+            if attribute.mutability in _restricted_mutabilities:
+                rules.append(
+                    MutabilityRule(
+                        name=attribute.name,
+                        sub_name=None,
+                        mutability=attribute.mutability,
+                        multi_valued=multi_valued,
+                        case_exact=bool(attribute.caseExact),
+                    )
+                )
+                continue
+            element = (
+                attribute.element_attribute
+                if isinstance(attribute, MultiValuedAttribute)
+                else attribute
+            )
+            if isinstance(element, ComplexAttribute):
+                for sub_attribute in element.subAttributes:
+                    if (
+                        isinstance(sub_attribute.name, str)
+                        and sub_attribute.mutability in _restricted_mutabilities
+                    ):
+                        rules.append(
+                            MutabilityRule(
+                                name=attribute.name,
+                                sub_name=sub_attribute.name,
+                                mutability=sub_attribute.mutability,
+                                multi_valued=multi_valued,
+                                case_exact=bool(sub_attribute.caseExact),
+                            )
+                        )
+        return rules
+
+    def get_attribute(self, path: str) -> Optional[Attribute]:
+        """
+        Look an attribute up by its path, ignoring case as attribute names are case insensitive
+        :param path: e.g. name.givenName or urn:ietf:params:scim:schemas:core:2.0:User:name.givenName
+        :return: the attribute (or sub-attribute) or None if the schema does not define it
+        """
+        return self._attribute_index.get(path.lower())
+
     def validate(self, d):
+        exceptions = []
         for attribute in self.attributes:
-            attribute.validate(d=deepcopy(d))
+            try:
+                attribute.validate(d=d)
+            except AssertionError as ae:
+                exceptions.append(ae)
+
+        if len(exceptions) > 0:
+            raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                location=self.id, exceptions=exceptions
+            )
+
+    def compile(self) -> Callable[..., None]:
+        """
+        Build (once) a validator equivalent to validate(d) out of the compiled attribute closures
+        :return: a callable taking the resource (or extension) dictionary to be validated and an optional ErrorBudget
+        """
+        if self._validator is None:
+            validators = [attribute.compile() for attribute in self.attributes]
+            location = self.id
+
+            def validate(d: Dict, budget: Optional[ErrorBudget] = None) -> None:
+                exceptions: List[BaseException] = []
+                for validate_attribute in validators:
+                    try:
+                        validate_attribute(d, budget)
+                    except AssertionError as ae:
+                        exceptions.append(ae)
+                        if budget is not None and budget.spend(ae):
+                            break
+
+                if len(exceptions) > 0:
+                    raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                        location=location, exceptions=exceptions
+                    )
+
+            self._validator = validate
+        return self._validator
 
     def validate_schema(self):
         exceptions = []
@@ -91,7 +258,7 @@ class Model(object):
             # OPTIONAL for scim schema - mandatory for service providers overriden via inheritance
             return
 
-        if not bool(re.match(r"^[a-zA-Z]*([a-zA-Z]|\s)*(\$|-|_|\w)$", self.name)):
+        if not bool(_name_pattern.match(self.name)):
             raise scim_exceptions.ModelInvalidPropertyException(
                 id=self.id,
                 property_name="name",
@@ -133,7 +300,7 @@ class Model(object):
 class MetaServiceProviderSchema(Model):
     def _validate_schema_name(self):
         if self.name is None or not bool(
-            re.match(self.name, r"^[\w]*(\$|\-|_|\d|\w)$")
+            _service_provider_name_pattern.match(self.name)
         ):
             raise scim_exceptions.ModelInvalidPropertyException(
                 id=self.id,
@@ -0,0 +1,189 @@
+from typing import Any, Dict, List, Optional
+
+from . import scim_exceptions
+from .model import Model, MutabilityRule
+
+# attributes common to all resources which are readOnly - https://tools.ietf.org/html/rfc7643#section-3.1
+_common_read_only_rules = [
+    MutabilityRule(
+        name=name,
+        sub_name=None,
+        mutability="readOnly",
+        multi_valued=False,
+        case_exact=True,
+    )
+    for name in ("id", "meta")
+]
+
+
+def _is_equal(value: Any, stored_value: Any, case_exact: bool) -> bool:
+    if not case_exact and isinstance(value, str) and isinstance(stored_value, str):
+        return value.lower() == stored_value.lower()
+    return value == stored_value
+
+
+def _get_keys(d: Any) -> Dict[str, List[str]]:
+    """
+    :return: the keys of a dictionary by their lower-cased value, as attribute names are case insensitive
+    """
+    keys: Dict[str, List[str]] = {}
+    if isinstance(d, dict):
+        for key in d:
+            if isinstance(key, str):
+                keys.setdefault(key.lower(), []).append(key)
+    return keys
+
+
+def _get_value(d: Any, keys: Dict[str, List[str]], name: str) -> Any:
+    matching_keys = keys.get(name)
+    return d[matching_keys[0]] if matching_keys else None
+
+
+def _strip(value: Dict, name: str) -> Dict:
+    return {
+        k: v for k, v in value.items() if not (isinstance(k, str) and k.lower() == name)
+    }
+
+
+def _enforce_rule(
+    rule: MutabilityRule,
+    key: str,
+    body: Dict,
+    stored_value: Any,
+    strip_read_only: bool,
+    locator: List[str],
+) -> None:
+    """
+    Apply a rule to the value of body at key (the body is modified when read only values are stripped)
+    """
+    value = body[key]
+
+    if rule.sub_name is not None:
+        sub_name = rule.sub_name.lower()
+        if rule.multi_valued:
+            # the values of a multi-valued attribute are not matched up with the stored ones, so an immutable
+            # sub-attribute only prevents changing a value in place - which a request body cannot express
+            if rule.mutability != "readOnly" or not isinstance(value, list):
+                return
+            if not any(sub_name in _get_keys(v) for v in value):
+                return
+            if strip_read_only:
+                body[key] = [
+                    _strip(v, sub_name) if isinstance(v, dict) else v for v in value
+                ]
+            elif value != stored_value:
+                raise scim_exceptions.ScimAttributeMutabilityException(
+                    locator + [rule.name, rule.sub_name],
+                    rule.mutability,
+                    value,
+                    stored_value,
+                )
+            return
+
+        sub_keys = _get_keys(value)
+        if sub_name not in sub_keys:
+            return
+        if rule.mutability == "readOnly" and strip_read_only:
+            body[key] = _strip(value, sub_name)
+            return
+        stored_sub_value = _get_value(stored_value, _get_keys(stored_value), sub_name)
+        for sub_key in sub_keys[sub_name]:
+            if (
+                rule.mutability == "readOnly" or stored_sub_value is not None
+            ) and not _is_equal(value[sub_key], stored_sub_value, rule.case_exact):
+                raise scim_exceptions.ScimAttributeMutabilityException(
+                    locator + [rule.name, rule.sub_name],
+                    rule.mutability,
+                    value[sub_key],
+                    stored_sub_value,
+                )
+        return
+
+    if rule.mutability == "readOnly" and strip_read_only:
+        del body[key]
+    elif (rule.mutability == "readOnly" or stored_value is not None) and not _is_equal(
+        value, stored_value, rule.case_exact
+    ):
+        raise scim_exceptions.ScimAttributeMutabilityException(
+            locator + [rule.name], rule.mutability, value, stored_value
+        )
+
+
+def _enforce_model(
+    model: Model,
+    rules: List[MutabilityRule],
+    body: Dict,
+    stored: Optional[Dict],
+    strip_read_only: bool,
+    exceptions: List[BaseException],
+) -> None:
+    locator = [model.id]
+    # attribute names are matched case insensitively, through the keys of body and stored indexed once
+    body_keys = _get_keys(body)
+    stored_keys = _get_keys(stored)
+    for rule in rules:
+        name = rule.name.lower()
+        for key in body_keys.get(name, ()):
+            # a value may have been stripped by a previous rule of the same attribute
+            if key not in body:
+                continue
+            try:
+                _enforce_rule(
+                    rule,
+                    key,
+                    body,
+                    _get_value(stored, stored_keys, name),
+                    strip_read_only,
+                    locator,
+                )
+            except AssertionError as ae:
+                exceptions.append(ae)
+
+
+def enforce_mutability(
+    data: Dict,
+    core_meta_schema: Model,
+    extension_meta_schemas: List[Model],
+    stored: Optional[Dict] = None,
+    strip_read_only: bool = True,
+) -> Dict:
+    """
+    Check a request body (e.g. of a POST or PUT) against the mutability of the attributes - only the attributes which are
+    readOnly or immutable are looked at. readOnly values are stripped (as servers SHALL ignore them) or, unless
+    strip_read_only, rejected when they differ from the stored resource; immutable values are rejected when they differ
+    from a value of the stored resource
+    :param stored: the resource as currently stored - None when the resource is being created
+    :return: a copy of the body without its readOnly values (when stripped)
+    """
+    body = dict(data)
+    exceptions: List[BaseException] = []
+    _enforce_model(
+        core_meta_schema,
+        _common_read_only_rules + core_meta_schema._mutability_rules,
+        body,
+        stored,
+        strip_read_only,
+        exceptions,
+    )
+    for extension_meta_schema in extension_meta_schemas:
+        extension_body = body.get(extension_meta_schema.id)
+        if isinstance(extension_body, dict) and extension_meta_schema._mutability_rules:
+            extension_body = body[extension_meta_schema.id] = dict(extension_body)
+            _enforce_model(
+                extension_meta_schema,
+                extension_meta_schema._mutability_rules,
+                extension_body,
+                (
+                    stored.get(extension_meta_schema.id)
+                    if isinstance(stored, dict)
+                    else None
+                ),
+                strip_read_only,
+                exceptions,
+            )
+
+    if len(exceptions) > 0:
+        raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+            location="Scim request", exceptions=exceptions
+        )
+    return body
@@ -0,0 +1,70 @@
+import os
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from .model import Model
+from .registry import SchemaRegistry
+
+# schemas of the current worker process - set once by _initialise_worker when the pool starts
+_worker_registry: Optional[SchemaRegistry] = None
+
+
+def _initialise_worker(
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+) -> None:
+    global _worker_registry
+    _worker_registry = SchemaRegistry(
+        core_schema_definitions, extension_schema_definitions
+    )
+
+
+def _validate_chunk(resources: List[Dict]) -> List[Optional[AssertionError]]:
+    assert _worker_registry is not None, "Worker was not initialised"
+    return list(_worker_registry.validate_many(resources))
+
+
+def _chunks(resources: Iterable[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+    iterator = iter(resources)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def validate_in_parallel(
+    resources: Iterable[Dict],
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[Optional[AssertionError]]:
+    """
+    Validate resources across a pool of processes - the schemas are sent to each worker once when the pool starts
+    and the resources are sent in chunks of chunk_size, with at most two chunks per worker in flight so that the
+    resources are only read as the workers get to them
+    :return: one entry per resource, in the order given - None if it is valid, otherwise the AssertionError it failed with
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1 but got {}".format(chunk_size))
+
+    # imported here as it pulls in multiprocessing, which would add to the import time of scimschema - a Pool rather
+    # than a ProcessPoolExecutor, whose initializer requires python 3.7
+    from multiprocessing import Pool
+
+    max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    results: List[Optional[AssertionError]] = []
+    with Pool(
+        processes=max_workers,
+        initializer=_initialise_worker,
+        initargs=(core_schema_definitions, extension_schema_definitions),
+    ) as pool:
+        pending: Deque = deque()
+        for chunk in _chunks(resources, chunk_size):
+            if len(pending) >= max_in_flight:
+                results.extend(pending.popleft().get())
+            pending.append(pool.apply_async(_validate_chunk, (chunk,)))
+        while pending:
+            results.extend(pending.popleft().get())
+    return results
@@ -0,0 +1,270 @@
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from . import scim_exceptions
+from .attribute import Attribute, MultiValuedAttribute
+from .model import Model
+from .scim_exceptions import ErrorBudget
+
+patch_op_schema = "urn:ietf:params:scim:api:messages:2.0:PatchOp"
+_operations = frozenset(["add", "remove", "replace"])
+# attributes common to all resources which are not defined by the schemas - https://tools.ietf.org/html/rfc7643#section-3.1
+_common_attributes = frozenset(["id", "externalid", "meta"])
+# ATTRNAME ["[" valFilter "]"] ["." subAttr] once the schema URN prefix has been removed
+_path_pattern = re.compile(
+    r"^(?P<name>[A-Za-z$][\w$-]*)(?:\[(?P<filter>.+)\])?(?:\.(?P<sub>[A-Za-z$][\w$-]*))?$"
+)
+
+
+class PatchTarget(NamedTuple):
+    """
+    What the path of an operation refers to - the attribute is None when the path is a whole schema (or is omitted)
+    and the model is None as well when the path is a common attribute (id, externalId, meta)
+    """
+
+    model: Optional[Model]
+    attribute: Optional[Attribute]
+    sub_attribute: Optional[Attribute]
+    filtered: bool
+
+
+def resolve_path(
+    path: str, core_meta_schema: Model, extension_meta_schemas: List[Model]
+) -> PatchTarget:
+    """
+    Resolve the path of a PATCH operation (e.g. name.givenName, emails[type eq "work"].value or
+    urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:manager) into the attribute it refers to
+    - filters are only checked to be on a multi-valued attribute as they select values of the resource
+    :return: the PatchTarget of the path
+    """
+    model = core_meta_schema
+    attribute_path = path
+    lower_path = path.lower()
+    for schema in [core_meta_schema] + extension_meta_schemas:
+        schema_id = schema.id.lower()
+        if lower_path == schema_id:
+            return PatchTarget(
+                model=schema, attribute=None, sub_attribute=None, filtered=False
+            )
+        if lower_path.startswith(schema_id + ":"):
+            model = schema
+            attribute_path = path[len(schema_id) + 1 :]
+            break
+
+    match = _path_pattern.match(attribute_path)
+    if match is None:
+        raise AssertionError("is not a valid attribute path")
+    name, value_filter, sub_name = match.group("name", "filter", "sub")
+
+    attribute = model.get_attribute(name)
+    if attribute is None:
+        if model is core_meta_schema and name.lower() in _common_attributes:
+            return PatchTarget(
+                model=None, attribute=None, sub_attribute=None, filtered=False
+            )
+        raise AssertionError("has unknown attribute '{}' in {}".format(name, model.id))
+    if value_filter is not None and not isinstance(attribute, MultiValuedAttribute):
+        raise AssertionError(
+            "has a filter on single-valued attribute '{}'".format(attribute.name)
+        )
+
+    sub_attribute = None
+    if sub_name is not None:
+        sub_attribute = model.get_attribute("{}.{}".format(name, sub_name))
+        if sub_attribute is None:
+            raise AssertionError(
+                "has unknown sub-attribute '{}' of '{}'".format(
+                    sub_name, attribute.name
+                )
+            )
+    return PatchTarget(
+        model=model,
+        attribute=attribute,
+        sub_attribute=sub_attribute,
+        filtered=value_filter is not None,
+    )
+
+
+def _validate_schema_values(
+    model: Model,
+    value: Any,
+    locator: List[str],
+    budget: Optional[ErrorBudget],
+    extension_meta_schemas: Sequence[Model] = (),
+) -> None:
+    """
+    Validate the attributes present in a value holding attributes of a schema - the attributes it does not hold are
+    left unchanged by the operation so required attributes are not checked
+    """
+    if not isinstance(value, dict):
+        raise scim_exceptions.ScimAttributeInvalidTypeException(
+            expected={"schema": model.id},
+            locator=locator,
+            value=value,
+            multi_value=False,
+            attribute_type="complex",
+            reference="https://tools.ietf.org/html/rfc7644#section-3.5.2",
+        )
+
+    exceptions: List[BaseException] = []
+    for attribute in model.attributes:
+        if attribute.name in value:
+            try:
+                attribute._get_value_validator()(value[attribute.name], budget)
+            except AssertionError as ae:
+                exceptions.append(ae)
+                if budget is not None and budget.spend(ae):
+                    break
+    for extension_meta_schema in extension_meta_schemas:
+        if budget is not None and budget.exhausted:
+            break
+        if extension_meta_schema.id in value:
+            try:
+                _validate_schema_values(
+                    extension_meta_schema,
+                    value[extension_meta_schema.id],
+                    locator + [extension_meta_schema.id],
+                    budget,
+                )
+            except AssertionError as ae:
+                exceptions.append(ae)
+                if budget is not None and budget.spend(ae):
+                    break
+
+    if len(exceptions) > 0:
+        raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+            location=locator, exceptions=exceptions
+        )
+
+
+def _validate_target_value(
+    target: PatchTarget, value: Any, budget: Optional[ErrorBudget]
+) -> None:
+    if target.sub_attribute is not None:
+        target.sub_attribute._get_value_validator()(value, budget)
+    elif target.attribute is not None:
+        attribute = target.attribute
+        if target.filtered and isinstance(attribute, MultiValuedAttribute):
+            # the filter selects values of the attribute, so the value replaces (or is merged into) these values
+            attribute = attribute.element_attribute
+        attribute._get_value_validator()(value, budget)
+
+
+def validate_operation(
+    operation: Any,
+    locator: List[str],
+    core_meta_schema: Model,
+    extension_meta_schemas: List[Model],
+    budget: Optional[ErrorBudget] = None,
+) -> None:
+    """
+    Validate a single PATCH operation - only the values it holds are validated, not the resource it applies to
+    """
+    if not isinstance(operation, dict):
+        raise scim_exceptions.ScimPatchInvalidOperationException(
+            locator=locator, property_name="", expected="an object", actual=operation
+        )
+
+    op = operation.get("op")
+    if not isinstance(op, str) or op.lower() not in _operations:
+        raise scim_exceptions.ScimPatchInvalidOperationException(
+            locator=locator,
+            property_name="op",
+            expected="one of {}".format(", ".join(sorted(_operations))),
+            actual=op,
+        )
+    op = op.lower()
+
+    path = operation.get("path")
+    if path is None:
+        if op == "remove":
+            raise scim_exceptions.ScimPatchInvalidOperationException(
+                locator=locator,
+                property_name="path",
+                expected="a path for a remove operation",
+                actual=path,
+            )
+        target = PatchTarget(
+            model=core_meta_schema, attribute=None, sub_attribute=None, filtered=False
+        )
+    elif not isinstance(path, str):
+        raise scim_exceptions.ScimPatchInvalidPathException(
+            locator=locator, path=path, info="is not a string"
+        )
+    else:
+        try:
+            target = resolve_path(path, core_meta_schema, extension_meta_schemas)
+        except AssertionError as ae:
+            raise scim_exceptions.ScimPatchInvalidPathException(
+                locator=locator, path=path, info=str(ae)
+            )
+
+    if "value" not in operation:
+        if op != "remove":
+            raise scim_exceptions.ScimPatchInvalidOperationException(
+                locator=locator,
+                property_name="value",
+                expected="a value for an {} operation".format(op),
+                actual=None,
+            )
+        return
+
+    value = operation["value"]
+    if target.attribute is not None:
+        _validate_target_value(target, value, budget)
+    elif target.model is not None:
+        _validate_schema_values(
+            target.model,
+            value,
+            locator + [target.model.id],
+            budget,
+            # without a path, the value may hold the attributes of the extensions under their URN
+            extension_meta_schemas=extension_meta_schemas if path is None else (),
+        )
+
+
+def validate_patch_operations(
+    data: Dict,
+    core_meta_schema: Model,
+    extension_meta_schemas: List[Model],
+    max_errors: Optional[int] = None,
+) -> None:
+    """
+    Validate a PatchOp request against the models of the resource it applies to - each operation's path is resolved to
+    the attribute it targets and only the values of the operations are validated
+    :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+    """
+    if not isinstance(data, dict) or patch_op_schema not in (data.get("schemas") or ()):
+        raise AssertionError(
+            "Patch request must specify the schema {}".format(patch_op_schema)
+        )
+
+    operations = data.get("Operations")
+    if not isinstance(operations, list) or len(operations) == 0:
+        raise scim_exceptions.ScimPatchInvalidOperationException(
+            locator=["Operations"],
+            property_name="Operations",
+            expected="a non-empty list of operations",
+            actual=operations,
+        )
+
+    budget = None if max_errors is None else ErrorBudget(max_errors)
+    exceptions = []
+    for i, operation in enumerate(operations):
+        try:
+            validate_operation(
+                operation,
+                ["Operations[{}]".format(i)],
+                core_meta_schema,
+                extension_meta_schemas,
+                budget,
+            )
+        except AssertionError as ae:
+            exceptions.append(ae)
+            if budget is not None and budget.spend(ae):
+                break
+
+    if len(exceptions) > 0:
+        raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+            location="Scim patch", exceptions=exceptions
+        )
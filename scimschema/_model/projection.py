@@ -0,0 +1,195 @@
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
+
+from .attribute import Attribute, ComplexAttribute, MultiValuedAttribute
+from .model import Model
+
+# attributes of a resource which are returned whatever the parameters - https://tools.ietf.org/html/rfc7643#section-3.1
+_always_returned = ("schemas", "id")
+
+
+def _get_sub_attributes(attribute: Attribute) -> List[Attribute]:
+    if isinstance(attribute, MultiValuedAttribute):
+        attribute = attribute.element_attribute
+    if isinstance(attribute, ComplexAttribute):
+        return attribute.subAttributes
+    return []
+
+
+def _parse_paths(paths: Union[str, Sequence[str], None]) -> Optional[List[str]]:
+    if paths is None:
+        return None
+    if isinstance(paths, str):
+        paths = paths.split(",")
+    return [path.strip().lower() for path in paths if path.strip()]
+
+
+class ProjectionPlan:
+    """
+    Which keys of a JSON object are returned - a key maps to True (returned as is), False (not returned) or to the plan
+    of its value (for complex attributes and extensions); keys not in the plan are returned if default is True
+    """
+
+    __slots__ = ("fields", "default")
+
+    def __init__(self, fields: Dict[str, Any], default: bool):
+        self.fields = fields
+        self.default = default
+
+    def _add(self, name: str, field: Any) -> None:
+        # indexed by the name defined by the schema (the usual case of the keys) and lower-cased as names are case
+        # insensitive
+        self.fields[name] = field
+        self.fields[name.lower()] = field
+
+    def apply(self, value: Dict) -> Dict:
+        fields = self.fields
+        default = self.default
+        result = {}
+        for key, v in value.items():
+            field = fields.get(key)
+            if field is None:
+                field = fields.get(key.lower(), default)
+            if field is True:
+                result[key] = v
+            elif field is not False:
+                if isinstance(v, dict):
+                    # a complex value (or extension) left without any attribute is not returned
+                    projected = field.apply(v)
+                    if projected:
+                        result[key] = projected
+                elif isinstance(v, list):
+                    result[key] = [
+                        field.apply(e) if isinstance(e, dict) else e for e in v
+                    ]
+                else:
+                    result[key] = v
+        return result
+
+
+def _build_plan(
+    attributes: List[Attribute],
+    requested: Optional[Set[str]],
+    excluded: Set[str],
+    prefix: str = "",
+) -> ProjectionPlan:
+    """
+    :param requested: lower-cased paths of the "attributes" parameter (relative to the schema) or None if not given
+    :param excluded: lower-cased paths of the "excludedAttributes" parameter (relative to the schema)
+    """
+    # attributes not defined by the schema (e.g. meta or externalId) are returned by default
+    plan = ProjectionPlan(fields={}, default=requested is None)
+    if requested is not None:
+        for path in requested:
+            name = (
+                path[len(prefix) :].split(".", 1)[0] if path.startswith(prefix) else ""
+            )
+            if name:
+                plan._add(name, True)
+    for path in excluded:
+        if path.startswith(prefix) and "." not in path[len(prefix) :]:
+            plan._add(path[len(prefix) :], False)
+
+    for attribute in attributes:
+        if not isinstance(attribute.name, str):
+            continue
+        path = prefix + attribute.name.lower()
+        if attribute.returned == "never":
+            plan._add(attribute.name, False)
+            continue
+
+        sub_requested = requested
+        if attribute.returned == "always":
+            selected = True
+        elif requested is not None:
+            selected = path in requested or any(
+                r.startswith(path + ".") for r in requested
+            )
+        else:
+            selected = attribute.returned != "request" and path not in excluded
+        if not selected:
+            plan._add(attribute.name, False)
+            continue
+        if requested is not None and (
+            path in requested or not any(r.startswith(path + ".") for r in requested)
+        ):
+            # the sub-attributes of an attribute requested as a whole are returned as if no attributes were requested
+            sub_requested = None
+
+        sub_attributes = _get_sub_attributes(attribute)
+        sub_plan = (
+            _build_plan(sub_attributes, sub_requested, excluded, path + ".")
+            if sub_attributes
+            else None
+        )
+        if sub_plan is None or (sub_plan.default and all(sub_plan.fields.values())):
+            plan._add(attribute.name, True)
+        else:
+            plan._add(attribute.name, sub_plan)
+    return plan
+
+
+def _relative_paths(paths: List[str], schema_id: str) -> Set[str]:
+    prefix = schema_id.lower() + ":"
+    return {path[len(prefix) :] for path in paths if path.startswith(prefix)}
+
+
+def build_projection_plan(
+    core_meta_schema: Model,
+    extension_meta_schemas: List[Model],
+    attributes: Union[str, Sequence[str], None] = None,
+    excluded_attributes: Union[str, Sequence[str], None] = None,
+) -> ProjectionPlan:
+    """
+    Build the plan returning the attributes of a resource as per their "returned" characteristic and the "attributes"
+    or "excludedAttributes" parameters - https://tools.ietf.org/html/rfc7644#section-3.9
+    :param attributes: the attribute paths to return, as a list or as the comma separated value of the parameter
+    :param excluded_attributes: the attribute paths not to return, as a list or as the comma separated value
+    """
+    requested = _parse_paths(attributes)
+    excluded = _parse_paths(excluded_attributes) or []
+    if requested is not None and excluded:
+        raise ValueError(
+            "attributes and excluded_attributes cannot be used together - got {} and {}".format(
+                attributes, excluded_attributes
+            )
+        )
+
+    # paths without a schema URN prefix (attribute names cannot contain ":") are paths of the core schema
+    core_requested = None
+    if requested is not None:
+        core_requested = _relative_paths(requested, core_meta_schema.id) | {
+            path for path in requested if ":" not in path
+        }
+    core_excluded = _relative_paths(excluded, core_meta_schema.id) | {
+        path for path in excluded if ":" not in path
+    }
+    plan = _build_plan(core_meta_schema.attributes, core_requested, core_excluded)
+
+    for extension_meta_schema in extension_meta_schemas:
+        extension_id = extension_meta_schema.id.lower()
+        if requested is not None and extension_id in requested:
+            plan._add(extension_meta_schema.id, True)
+            continue
+        if extension_id in excluded:
+            plan._add(extension_meta_schema.id, False)
+            continue
+        extension_requested = (
+            None
+            if requested is None
+            else _relative_paths(requested, extension_meta_schema.id)
+        )
+        if extension_requested is not None and len(extension_requested) == 0:
+            plan._add(extension_meta_schema.id, False)
+            continue
+        plan._add(
+            extension_meta_schema.id,
+            _build_plan(
+                extension_meta_schema.attributes,
+                extension_requested,
+                _relative_paths(excluded, extension_meta_schema.id),
+            ),
+        )
+
+    for name in _always_returned:
+        plan._add(name, True)
+    return plan
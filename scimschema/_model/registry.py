@@ -0,0 +1,327 @@
+import hashlib
+import pickle
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from . import scim_exceptions
+from .model import Model
+from .mutability import enforce_mutability
+from .patch import validate_patch_operations
+from .projection import ProjectionPlan, _parse_paths, build_projection_plan
+from .schema_response import (
+    MetaSchemas,
+    _check_schema_names,
+    get_meta_schemas,
+    validate_resource,
+)
+from .uniqueness import UniquenessIndex
+
+ResultKey = Tuple[bytes, Optional[int]]
+PlanKey = Tuple[Tuple[str, ...], Optional[Tuple[str, ...]], Optional[Tuple[str, ...]]]
+# the plans (and resolved schemas) are keyed by request parameters, so only the most recently used ones are kept
+_projection_plan_cache_size = 256
+_meta_schemas_cache_size = 256
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _get_result_key(data: Dict, max_errors: Optional[int]) -> Optional[ResultKey]:
+    """
+    :return: a hash of the pickled data (which includes its "schemas") or None if data cannot be pickled
+    """
+    # pickle is several times faster than a sorted JSON dump and tells apart values JSON would not (e.g. a list from a
+    # tuple) - the same payload with its keys in another order is only a cache miss
+    try:
+        dump = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return hashlib.sha256(dump).digest(), max_errors
+
+
+class SchemaRegistry:
+    """
+    Core and extension models indexed by their URN (id), which caches the models resolved for each distinct
+    "schemas" combination so that resolving a response's schemas is a single dictionary lookup.
+    With a result_cache_size, the outcome of validating the last result_cache_size distinct payloads is kept so that
+    a payload validated before (e.g. an unchanged user re-sent by a full sync) is not validated again
+    """
+
+    def __init__(
+        self,
+        core_schema_definitions: Mapping[str, Model],
+        extension_schema_definitions: Optional[Dict[str, Model]] = None,
+        result_cache_size: int = 0,
+    ):
+        if result_cache_size < 0:
+            raise ValueError(
+                "result_cache_size must be at least 0 but got {}".format(
+                    result_cache_size
+                )
+            )
+        # the core models are only copied once a core model is registered, so that lazily loaded core schemas are
+        # only loaded when a response refers to them
+        self._core_schema_definitions = core_schema_definitions
+        self._extension_schema_definitions = dict(extension_schema_definitions or {})
+        self._meta_schemas: "OrderedDict[Tuple[str, ...], MetaSchemas]" = OrderedDict()
+        self._result_cache_size = result_cache_size
+        # an error is kept pickled, as the fields of the exception refer to parts of the payload
+        self._results: "OrderedDict[ResultKey, Optional[bytes]]" = OrderedDict()
+        self._projection_plans: "OrderedDict[PlanKey, ProjectionPlan]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, schema_id: str) -> bool:
+        return (
+            schema_id in self._core_schema_definitions
+            or schema_id in self._extension_schema_definitions
+        )
+
+    def get_model(self, schema_id: str) -> Model:
+        try:
+            return self._core_schema_definitions[schema_id]
+        except KeyError:
+            return self._extension_schema_definitions[schema_id]
+
+    def register(self, model: Model, core: bool = False) -> None:
+        """
+        Add (or replace) a core or extension model - cached resolutions, results and projection plans are discarded
+        """
+        if core:
+            core_schema_definitions = dict(self._core_schema_definitions)
+            core_schema_definitions[model.id] = model
+            self._core_schema_definitions = core_schema_definitions
+        else:
+            self._extension_schema_definitions[model.id] = model
+        self._meta_schemas.clear()
+        self._results.clear()
+        self._projection_plans.clear()
+
+    def resolve(self, schema_names: Optional[Sequence[str]]) -> MetaSchemas:
+        """
+        :return: a tuple of (core models, extension models) for the "schemas" of a response
+        """
+        _check_schema_names(schema_names)
+        key = tuple(schema_names or ())
+        try:
+            meta_schemas = self._meta_schemas[key]
+        except KeyError:
+            meta_schemas = get_meta_schemas(
+                key, self._core_schema_definitions, self._extension_schema_definitions
+            )
+            self._meta_schemas[key] = meta_schemas
+            if len(self._meta_schemas) > _meta_schemas_cache_size:
+                self._meta_schemas.popitem(last=False)
+        else:
+            self._meta_schemas.move_to_end(key)
+        return meta_schemas
+
+    def validate(self, data: Dict, max_errors: Optional[int] = None) -> None:
+        """
+        :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+        """
+        if not isinstance(data, dict):
+            raise AssertionError(
+                "Resource must be a JSON object but got {}".format(type(data).__name__)
+            )
+        key = _get_result_key(data, max_errors) if self._result_cache_size else None
+        if key is None:
+            self._validate(data, max_errors)
+            return
+
+        try:
+            pickled_error = self._results[key]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            self._results.move_to_end(key)
+            if pickled_error is not None:
+                # a new exception for each hit, which the caller may keep or change
+                raise pickle.loads(pickled_error)
+            return
+
+        self._misses += 1
+        try:
+            self._validate(data, max_errors)
+        except AssertionError as ae:
+            try:
+                pickled_error = pickle.dumps(ae, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                # not cached, as a copy detached from the payload cannot be kept
+                pickled_error = None
+            if pickled_error is not None:
+                self._cache_result(key, pickled_error)
+            raise
+        self._cache_result(key, None)
+
+    def _cache_result(self, key: ResultKey, pickled_error: Optional[bytes]) -> None:
+        self._results[key] = pickled_error
+        if len(self._results) > self._result_cache_size:
+            self._results.popitem(last=False)
+
+    def _validate(self, data: Dict, max_errors: Optional[int]) -> None:
+        core_meta_schemas, extension_meta_schemas = self.resolve(data.get("schemas"))
+        validate_resource(
+            data, core_meta_schemas, extension_meta_schemas, max_errors=max_errors
+        )
+
+    def validate_patch(
+        self,
+        data: Dict,
+        schema_names: Sequence[str],
+        max_errors: Optional[int] = None,
+    ) -> None:
+        """
+        Validate a PatchOp request against the models of the resource it applies to
+        :param schema_names: the "schemas" of the resource being patched
+        :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+        """
+        core_meta_schemas, extension_meta_schemas = self.resolve(schema_names)
+        validate_patch_operations(
+            data, core_meta_schemas[0], extension_meta_schemas, max_errors=max_errors
+        )
+
+    def enforce_mutability(
+        self,
+        data: Dict,
+        stored: Optional[Dict] = None,
+        strip_read_only: bool = True,
+    ) -> Dict:
+        """
+        Check a request body against the mutability of its attributes
+        :param stored: the resource as currently stored - None when the resource is being created
+        :param strip_read_only: strip readOnly values (default) instead of rejecting those differing from the stored ones
+        :return: a copy of the body without its readOnly values (when stripped)
+        """
+        core_meta_schemas, extension_meta_schemas = self.resolve(data.get("schemas"))
+        return enforce_mutability(
+            data,
+            core_meta_schemas[0],
+            extension_meta_schemas,
+            stored=stored,
+            strip_read_only=strip_read_only,
+        )
+
+    def get_projection_plan(
+        self,
+        schema_names: Optional[Sequence[str]],
+        attributes: Union[str, Sequence[str], None] = None,
+        excluded_attributes: Union[str, Sequence[str], None] = None,
+    ) -> ProjectionPlan:
+        """
+        :return: the (cached) plan returning the attributes of a resource with these "schemas" as per their "returned"
+        characteristic and the "attributes" or "excludedAttributes" parameters
+        """
+        _check_schema_names(schema_names)
+        requested = _parse_paths(attributes)
+        excluded = _parse_paths(excluded_attributes)
+        key = (
+            tuple(schema_names or ()),
+            None if requested is None else tuple(requested),
+            None if excluded is None else tuple(excluded),
+        )
+        try:
+            plan = self._projection_plans[key]
+        except KeyError:
+            core_meta_schemas, extension_meta_schemas = self.resolve(key[0])
+            plan = build_projection_plan(
+                core_meta_schemas[0], extension_meta_schemas, requested, excluded
+            )
+            self._projection_plans[key] = plan
+            if len(self._projection_plans) > _projection_plan_cache_size:
+                self._projection_plans.popitem(last=False)
+        else:
+            self._projection_plans.move_to_end(key)
+        return plan
+
+    def project(
+        self,
+        data: Dict,
+        attributes: Union[str, Sequence[str], None] = None,
+        excluded_attributes: Union[str, Sequence[str], None] = None,
+    ) -> Dict:
+        """
+        :param attributes: the attribute paths to return, as a list or as the comma separated value of the parameter
+        :param excluded_attributes: the attribute paths not to return, as a list or as the comma separated value
+        :return: a copy of the resource holding the attributes to be returned - https://tools.ietf.org/html/rfc7644#section-3.9
+        """
+        return self.get_projection_plan(
+            data.get("schemas"), attributes, excluded_attributes
+        ).apply(data)
+
+    def result_cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            maxsize=self._result_cache_size,
+            currsize=len(self._results),
+        )
+
+    def validate_many(
+        self,
+        resources: Iterable[Dict],
+        max_errors: Optional[int] = None,
+        uniqueness_index: Optional[UniquenessIndex] = None,
+    ) -> Iterator[Optional[AssertionError]]:
+        """
+        :param max_errors: stop validating a resource once this many errors are found in it - default None validates all
+        :param uniqueness_index: also check that the unique attributes (e.g. id or userName) of each resource are not
+        used by a resource validated before with the same index
+        :return: an iterator yielding None for a valid resource or the AssertionError it failed with
+        """
+        for resource in resources:
+            exceptions = []
+            try:
+                self.validate(resource, max_errors=max_errors)
+            except AssertionError as ae:
+                exceptions.append(ae)
+            if uniqueness_index is not None and isinstance(resource, dict):
+                try:
+                    uniqueness_index.add(
+                        resource, *self.resolve(resource.get("schemas"))
+                    )
+                except AssertionError as ae:
+                    # schemas which cannot be resolved have already been reported by validate
+                    if not exceptions:
+                        exceptions.append(ae)
+            if len(exceptions) == 0:
+                yield None
+            elif len(exceptions) == 1:
+                yield exceptions[0]
+            else:
+                yield scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                    location="Scim response", exceptions=exceptions
+                )
+
+
+def validate_resources(
+    resources: Iterable[Dict],
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    max_errors: Optional[int] = None,
+    uniqueness_index: Optional[UniquenessIndex] = None,
+) -> Iterator[Optional[AssertionError]]:
+    """
+    Validate each resource in turn, resolving each distinct "schemas" combination only once
+    :param max_errors: stop validating a resource once this many errors are found in it - default None validates all
+    :param uniqueness_index: also check the unique attributes of each resource against the resources validated before
+    :return: an iterator yielding None for a valid resource or the AssertionError it failed with
+    """
+    return SchemaRegistry(
+        core_schema_definitions, extension_schema_definitions
+    ).validate_many(resources, max_errors=max_errors, uniqueness_index=uniqueness_index)
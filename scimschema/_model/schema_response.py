@@ -1,4 +1,102 @@
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
 from .._model import scim_exceptions
+from .model import Model
+
+MetaSchemas = Tuple[List[Model], List[Model]]
+
+
+def _check_schema_names(schema_names: Optional[Sequence[str]]) -> None:
+    if schema_names is None:
+        return
+    if not isinstance(schema_names, (list, tuple)) or not all(
+        isinstance(schema_name, str) for schema_name in schema_names
+    ):
+        raise AssertionError(
+            "Response schemas must be a list of strings but got '{}'".format(
+                schema_names
+            )
+        )
+
+
+def get_meta_schemas(
+    schema_names: Optional[Sequence[str]],
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+) -> MetaSchemas:
+    """
+    Resolve the "schemas" of a response into its core and extension models
+    :return: a tuple of (core models, extension models)
+    """
+    _check_schema_names(schema_names)
+    if schema_names is None or len(schema_names) == 0:
+        raise AssertionError("Response has no specified schema")
+
+    core_meta_schemas = []
+    extension_meta_schemas = []
+    # a schema repeated is only validated once
+    for schema_name in OrderedDict.fromkeys(schema_names):
+        if schema_name in core_schema_definitions:
+            core_meta_schemas.append(core_schema_definitions[schema_name])
+        elif schema_name in extension_schema_definitions:
+            extension_meta_schemas.append(extension_schema_definitions[schema_name])
+        else:
+            raise AssertionError("Response has unknown schema - {}".format(schema_name))
+
+    if len(core_meta_schemas) != 1:
+        raise AssertionError(
+            "Response must specify exactly one core schema - {}".format(
+                ", ".join([s.id for s in core_meta_schemas])
+            )
+        )
+    return core_meta_schemas, extension_meta_schemas
+
+
+def validate_resource(
+    data: Dict,
+    core_meta_schemas: List[Model],
+    extension_meta_schemas: List[Model],
+    max_errors: Optional[int] = None,
+) -> None:
+    """
+    Validate the data against its extension and core models
+    :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+    """
+    budget = None if max_errors is None else scim_exceptions.ErrorBudget(max_errors)
+    exceptions = []
+    for extension_schema_model in extension_meta_schemas:
+        tmp_data = data.get(extension_schema_model.id, {})
+        try:
+            if not isinstance(tmp_data, dict):
+                raise scim_exceptions.ScimAttributeInvalidTypeException(
+                    expected={"schema": extension_schema_model.id},
+                    locator=[extension_schema_model.id],
+                    value=tmp_data,
+                    multi_value=False,
+                    attribute_type="complex",
+                    reference="https://tools.ietf.org/html/rfc7643#section-3.3",
+                )
+            extension_schema_model.compile()(tmp_data, budget)
+        except AssertionError as ae:
+            exceptions.append(ae)
+            if budget is not None and budget.spend(ae):
+                break
+
+    for core_schema_model in core_meta_schemas:
+        if budget is not None and budget.exhausted:
+            break
+        try:
+            core_schema_model.compile()(data, budget)
+        except AssertionError as ae:
+            exceptions.append(ae)
+            if budget is not None and budget.spend(ae):
+                break
+
+    if len(exceptions) > 0:
+        raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+            location="Scim response", exceptions=exceptions
+        )
 
 
 class ScimResponse(dict):
@@ -14,50 +112,30 @@ class ScimResponse(dict):
         ) = self._get_meta_schemas(
             core_schema_definitions, extension_schema_definitions
         )
-        if len(self._core_meta_schemas) != 1:
-            raise AssertionError(
-                "Response must specify exactly one core schema - {}".format(
-                    ", ".join([s.id for s in self._core_meta_schemas])
-                )
-            )
 
     def _get_meta_schemas(self, core_schema_definitions, extension_schema_definitions):
-        schema_names = self.get("schemas")
-
-        if schema_names is None or len(schema_names) == 0:
-            raise AssertionError("Response has no specified schema")
-
-        core_schema_names = list(core_schema_definitions.keys())
-        core_meta_schemas = [
-            core_schema_definitions[schema_name]
-            for schema_name in schema_names
-            if schema_name in core_schema_names
-        ]
-
-        extension_meta_schemas = [
-            extension_schema_definitions[schema_name]
-            for schema_name in schema_names
-            if schema_name not in core_schema_names
-        ]
-        return core_meta_schemas, extension_meta_schemas
-
-    def validate(self):
-        data = self.copy()
-        exceptions = []
-        for extension_schema_model in self._extension_schema_definitions:
-            tmp_data = data.pop(extension_schema_model.id, {})
-            try:
-                extension_schema_model.validate(tmp_data)
-            except AssertionError as ae:
-                exceptions.append(ae)
-
-        for core_schema_model in self._core_meta_schemas:
-            try:
-                core_schema_model.validate(data)
-            except AssertionError as ae:
-                exceptions.append(ae)
-
-        if len(exceptions) > 0:
-            raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
-                location="Scim response", exceptions=exceptions
-            )
+        return get_meta_schemas(
+            self.get("schemas"), core_schema_definitions, extension_schema_definitions
+        )
+
+    def validate(self, max_errors: Optional[int] = None):
+        """
+        :param max_errors: stop validating once this many errors are found (1 to fail fast) - default None validates all
+        """
+        validate_resource(
+            self,
+            self._core_meta_schemas,
+            self._extension_schema_definitions,
+            max_errors=max_errors,
+        )
+
+    def errors(self) -> List[scim_exceptions.ScimError]:
+        """
+        Validate the response and return the errors found as a flat list of records instead of raising
+        :return: an empty list if the response is valid
+        """
+        try:
+            self.validate()
+        except AssertionError as ae:
+            return scim_exceptions.get_errors(ae)
+        return []
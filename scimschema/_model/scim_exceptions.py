@@ -1,38 +1,166 @@
 # Schema / Model exceptions
-from typing import Any, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
 
+# scimType of the SCIM Error response matching each error code - https://tools.ietf.org/html/rfc7644#section-3.12
+_scim_types = {
+    "required": "invalidValue",
+    "invalidType": "invalidValue",
+    "duplicate": "uniqueness",
+    "primary": "invalidValue",
+    "invalidSchema": "invalidSyntax",
+    "invalidPath": "invalidPath",
+    "invalidOperation": "invalidSyntax",
+    "mutability": "mutability",
+}
 
-class AggregatedScimSchemaExceptions(AssertionError):
-    def __init__(self, location, exceptions):
-        msg = "Invalid SCIM schema {}: {} aggregated exceptions found: \n {}".format(
-            location,
-            len(exceptions),
-            "\n\t".join(
-                [
-                    "{}: \n \t {}".format(e.__class__.__name__, str(e))
-                    for e in exceptions
-                ]
+
+class ScimError(NamedTuple):
+    """
+    A single validation error - the fields are kept as they are and only rendered when str() is called
+    """
+
+    path: Tuple[str, ...]
+    code: str
+    expected: Any
+    actual: Any
+    reference: Optional[str]
+
+    @property
+    def scim_type(self) -> str:
+        return _scim_types.get(self.code, "invalidValue")
+
+    def __str__(self) -> str:
+        return "{} at path {}: expected {} but got '{}' ({})".format(
+            self.code, "/".join(self.path), self.expected, self.actual, self.reference
+        )
+
+
+def _as_path(locator) -> Tuple[str, ...]:
+    if locator is None:
+        return ()
+    if isinstance(locator, str):
+        return (locator,)
+    return tuple(locator)
+
+
+def get_errors(exception: BaseException) -> List[ScimError]:
+    """
+    Flatten an exception raised by validation (and the exceptions it aggregates) into a list of error records
+    """
+    if isinstance(exception, ScimException):
+        return exception.errors()
+    return [
+        ScimError(
+            path=(),
+            code="invalidValue",
+            expected=None,
+            actual=exception,
+            reference=None,
+        )
+    ]
+
+
+def _restore_exception(
+    cls: Type["ScimException"], args: Tuple, state: Dict
+) -> "ScimException":
+    exception = cls.__new__(cls)
+    exception.args = args
+    exception.__dict__.update(state)
+    return exception
+
+
+class ScimException(AssertionError):
+    """
+    Base of the scim exceptions - they only store their fields and render the message when str() is called, as most
+    of them are raised and caught without ever being displayed.
+    They are rebuilt from their state when unpickled (e.g. when returned by a worker process)
+    """
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(self.__class__.__name__, str(self))
+
+    def errors(self) -> List[ScimError]:
+        raise NotImplementedError(
+            "Abstract class ScimException does not have errors - use a concrete Class"
+        )
+
+    def __reduce__(self):
+        return _restore_exception, (self.__class__, self.args, self.__dict__)
+
+
+class ErrorBudget:
+    """
+    Counts the errors found while validating so that validation can stop once max_errors have been found
+    """
+
+    def __init__(self, max_errors: Optional[int] = None):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(
+                "max_errors must be at least 1 but got {}".format(max_errors)
+            )
+        self.max_errors = max_errors
+        self.count = 0
+
+    def spend(self, exception: BaseException) -> bool:
+        """
+        Count an exception caught by validation - aggregated exceptions are not counted again since their own
+        exceptions were counted when they were caught
+        :return: True if validation should stop
+        """
+        if self.max_errors is None:
+            return False
+        if not isinstance(
+            exception,
+            (
+                AggregatedScimSchemaExceptions,
+                AggregatedScimMultValueAttributeValidationExceptions,
             ),
+        ):
+            self.count += 1
+        return self.exhausted
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_errors is not None and self.count >= self.max_errors
+
+
+def _format_exceptions(exceptions: List[BaseException]) -> str:
+    return "\n\t".join(
+        ["{}: \n \t {}".format(e.__class__.__name__, str(e)) for e in exceptions]
+    )
+
+
+class AggregatedScimSchemaExceptions(ScimException):
+    def __init__(self, location, exceptions):
+        super().__init__()
+        self.location = location
+        self.exceptions = exceptions
+
+    def __str__(self) -> str:
+        return "Invalid SCIM schema {}: {} aggregated exceptions found: \n {}".format(
+            self.location, len(self.exceptions), _format_exceptions(self.exceptions)
         )
-        super().__init__(msg)
+
+    def errors(self) -> List[ScimError]:
+        return [error for e in self.exceptions for error in get_errors(e)]
 
 
-class AggregatedScimMultValueAttributeValidationExceptions(AssertionError):
+class AggregatedScimMultValueAttributeValidationExceptions(ScimException):
     def __init__(self, location, exceptions):
-        msg = "Found {} aggregated exceptions at {}: \n {}".format(
-            len(exceptions),
-            location,
-            "\n\t".join(
-                [
-                    "{}: \n \t {}".format(e.__class__.__name__, str(e))
-                    for e in exceptions
-                ]
-            ),
+        super().__init__()
+        self.location = location
+        self.exceptions = exceptions
+
+    def __str__(self) -> str:
+        return "Found {} aggregated exceptions at {}: \n {}".format(
+            len(self.exceptions), self.location, _format_exceptions(self.exceptions)
         )
-        super().__init__(msg)
+
+    def errors(self) -> List[ScimError]:
+        return [error for e in self.exceptions for error in get_errors(e)]
 
 
-class ModelInvalidPropertyException(AssertionError):
+class ModelInvalidPropertyException(ScimException):
     def __init__(
         self,
         id,
@@ -41,53 +169,139 @@ class ModelInvalidPropertyException(AssertionError):
         actual,
         reference="https://tools.ietf.org/html/rfc7643#section-2.1",
     ):
-        msg = (
+        super().__init__()
+        self.id = id
+        self.property_name = property_name
+        self.expected = expected
+        self.actual = actual
+        self.reference = reference
+
+    def __str__(self) -> str:
+        return (
             "Model schema id {} has property {}"
             " which is expected to be {} but got "
             "{}"
-            " ({})".format(id, property_name, expected, actual, reference)
+            " ({})".format(
+                self.id, self.property_name, self.expected, self.actual, self.reference
+            )
         )
-        super().__init__(msg)
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=(self.id, self.property_name),
+                code="invalidSchema",
+                expected=self.expected,
+                actual=self.actual,
+                reference=self.reference,
+            )
+        ]
 
 
-class ModelAttributeUnknownPropertyException(AssertionError):
+class ModelAttributeUnknownPropertyException(ScimException):
     def __init__(self, attribute_name, locator, info):
-        super().__init__(
-            "Unknown properties {} on attribute '{} (path: '{}''".format(
-                info, attribute_name, locator
-            )
+        super().__init__()
+        self.attribute_name = attribute_name
+        self.locator = locator
+        self.info = info
+
+    def __str__(self) -> str:
+        return "Unknown properties {} on attribute '{} (path: '{}''".format(
+            self.info, self.attribute_name, self.locator
         )
 
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="invalidSchema",
+                expected="known properties",
+                actual=self.info,
+                reference="https://tools.ietf.org/html/rfc7643#section-7",
+            )
+        ]
+
 
-class ModelAttributeCharacteristicNotAllowedException(AssertionError):
+class ModelAttributeCharacteristicNotAllowedException(ScimException):
     def __init__(self, locator_path, attribute_name, expected, actual):
-        msg = (
+        super().__init__()
+        self.locator_path = locator_path
+        self.attribute_name = attribute_name
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self) -> str:
+        return (
             "Attribute "
             "{}"
             " and "
             "has '{}' property which must be {} but got '{}' (https://tools.ietf.org/html/rfc7643#section-2.1)".format(
-                locator_path, attribute_name, expected, actual
+                self.locator_path, self.attribute_name, self.expected, self.actual
             )
         )
-        super().__init__(msg)
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator_path) + (self.attribute_name,),
+                code="invalidSchema",
+                expected=self.expected,
+                actual=self.actual,
+                reference="https://tools.ietf.org/html/rfc7643#section-2.1",
+            )
+        ]
 
 
 # Value exceptions
 
 
-class ScimAttributeValueNotFoundException(AssertionError):
+def _multi_value_label(multi_value: bool) -> str:
+    return "Single-value attribute" if not multi_value else "Multi-value attribute"
+
+
+class ScimAttributeValueNotFoundException(ScimException):
     def __init__(self, d, locator, attribute_name, multi_value):
-        mv_attribute = (
-            "Single-value attribute" if not multi_value else "Multi-value attribute"
-        )
-        super().__init__(
+        super().__init__()
+        # only the keys of d (or the number of empty values of a multi-valued attribute) are kept rather than d itself,
+        # which may be large and changed once validated
+        if isinstance(d, dict):
+            self.found_keys: Optional[Tuple[Any, ...]] = tuple(d)
+            self.empty_value_count = 0
+        else:
+            self.found_keys = None
+            self.empty_value_count = len(d) if isinstance(d, list) else 0
+        self.locator = locator
+        self.attribute_name = attribute_name
+        self.multi_value = multi_value
+
+    def _format_found(self) -> str:
+        if self.found_keys is None:
+            return "{} empty value(s)".format(self.empty_value_count)
+        return "{" + ", ".join(repr(key) for key in self.found_keys) + "}"
+
+    def __str__(self) -> str:
+        return (
             "'{}:{}' is required at the following location '{}' but found '{}'".format(
-                mv_attribute, attribute_name, locator, d
+                _multi_value_label(self.multi_value),
+                self.attribute_name,
+                self.locator,
+                self._format_found(),
             )
         )
 
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="required",
+                expected="a value",
+                actual=None,
+                reference="https://tools.ietf.org/html/rfc7643#section-7",
+            )
+        ]
+
 
-class ScimAttributeInvalidTypeException(AssertionError):
+class ScimAttributeInvalidTypeException(ScimException):
     def __init__(
         self,
         expected: dict,
@@ -98,35 +312,184 @@ class ScimAttributeInvalidTypeException(AssertionError):
         sub_attributes_exceptions=None,
         reference=None,
     ):
-        locator = locator or []
-        path = "/".join(locator)
-        mv_attribute = (
-            "Single-value attribute" if not multi_value else "Multi-value attribute"
-        )
-        error_msg = (
-            "'{}: '{}' (at path: {}) is expected to be '{}' (see: {} {})".format(
-                mv_attribute, value, path, attribute_type, expected, reference
-            )
+        super().__init__()
+        self.expected = expected
+        self.locator = locator or []
+        self.value = value
+        self.multi_value = multi_value
+        self.attribute_type = attribute_type
+        self.sub_attributes_exceptions = sub_attributes_exceptions
+        self.reference = reference
+
+    def __str__(self) -> str:
+        return "'{}: '{}' (at path: {}) is expected to be '{}' (see: {} {})".format(
+            _multi_value_label(self.multi_value),
+            self.value,
+            "/".join(self.locator),
+            self.attribute_type,
+            self.expected,
+            self.reference,
         )
-        if not sub_attributes_exceptions:
-            super().__init__(sub_attributes_exceptions, error_msg)
-        else:
-            super().__init__(error_msg)
 
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="invalidType",
+                expected=self.attribute_type,
+                actual=self.value,
+                reference=self.reference,
+            )
+        ]
 
-class ScimAttributeDuplicateValueException(AssertionError):
+
+class ScimAttributeDuplicateValueException(ScimException):
     def __init__(self, locator, value):
-        path = "/".join(locator)
-        error_msg = "'Multi-value attribute: '{}' (at path: {}) is not unique as required".format(
-            value, path
+        super().__init__()
+        self.locator = locator
+        self.value = value
+
+    def __str__(self) -> str:
+        return "'Multi-value attribute: '{}' (at path: {}) is not unique as required".format(
+            self.value, "/".join(self.locator)
         )
-        super().__init__(error_msg)
 
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="duplicate",
+                expected="unique values",
+                actual=self.value,
+                reference="https://tools.ietf.org/html/rfc7643#section-2.4",
+            )
+        ]
+
+
+class ScimAttributeNotUniqueException(ScimException):
+    def __init__(self, locator, value, uniqueness, resource):
+        super().__init__()
+        self.locator = locator
+        self.value = value
+        self.uniqueness = uniqueness
+        self.resource = resource
 
-class ScimAttributeInvalidPrimaryPropertyException(AssertionError):
+    def __str__(self) -> str:
+        return "Attribute (at path: {}) has value '{}' which is already used by resource '{}' (uniqueness: {})".format(
+            "/".join(self.locator), self.value, self.resource, self.uniqueness
+        )
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="duplicate",
+                expected="a value unique across the resources ({})".format(
+                    self.uniqueness
+                ),
+                actual=self.value,
+                reference="https://tools.ietf.org/html/rfc7643#section-2.1",
+            )
+        ]
+
+
+class ScimAttributeInvalidPrimaryPropertyException(ScimException):
     def __init__(self, locator, value):
-        path = "/".join(locator)
-        error_msg = "'Multi-value attribute: '{}' (at path: {}) has more than one values with 'primary' property".format(
-            value, path
+        super().__init__()
+        self.locator = locator
+        self.value = value
+
+    def __str__(self) -> str:
+        return "'Multi-value attribute: '{}' (at path: {}) has more than one values with 'primary' property".format(
+            self.value, "/".join(self.locator)
         )
-        super().__init__(error_msg)
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="primary",
+                expected="at most one value with 'primary' set to true",
+                actual=self.value,
+                reference="https://tools.ietf.org/html/rfc7643#section-2.4",
+            )
+        ]
+
+
+class ScimAttributeMutabilityException(ScimException):
+    def __init__(self, locator, mutability, value, stored_value):
+        super().__init__()
+        self.locator = locator
+        self.mutability = mutability
+        self.value = value
+        self.stored_value = stored_value
+
+    def __str__(self) -> str:
+        return "Attribute (at path: {}) is {} and cannot be set to '{}' (stored value: '{}') (https://tools.ietf.org/html/rfc7643#section-2.2)".format(
+            "/".join(self.locator), self.mutability, self.value, self.stored_value
+        )
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator),
+                code="mutability",
+                expected="the stored value ({}) as the attribute is {}".format(
+                    self.stored_value, self.mutability
+                ),
+                actual=self.value,
+                reference="https://tools.ietf.org/html/rfc7643#section-2.2",
+            )
+        ]
+
+
+# Patch exceptions
+
+
+class ScimPatchInvalidOperationException(ScimException):
+    def __init__(self, locator, property_name, expected, actual):
+        super().__init__()
+        self.locator = locator
+        self.property_name = property_name
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self) -> str:
+        return "Patch operation (at path: {}) has property '{}' which is expected to be {} but got '{}' (https://tools.ietf.org/html/rfc7644#section-3.5.2)".format(
+            "/".join(self.locator), self.property_name, self.expected, self.actual
+        )
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator) + (self.property_name,),
+                code="invalidOperation",
+                expected=self.expected,
+                actual=self.actual,
+                reference="https://tools.ietf.org/html/rfc7644#section-3.5.2",
+            )
+        ]
+
+
+class ScimPatchInvalidPathException(ScimException):
+    def __init__(self, locator, path, info):
+        super().__init__()
+        self.locator = locator
+        self.path = path
+        self.info = info
+
+    def __str__(self) -> str:
+        return "Patch operation (at path: {}) has path '{}' which {} (https://tools.ietf.org/html/rfc7644#section-3.5.2)".format(
+            "/".join(self.locator), self.path, self.info
+        )
+
+    def errors(self) -> List[ScimError]:
+        return [
+            ScimError(
+                path=_as_path(self.locator) + ("path",),
+                code="invalidPath",
+                expected="a path to an attribute of the resource schemas",
+                actual=self.path,
+                reference="https://tools.ietf.org/html/rfc7644#section-3.5.2",
+            )
+        ]
@@ -0,0 +1,190 @@
+import codecs
+import json
+import re
+from itertools import tee
+from typing import IO, Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from .model import Model
+from .registry import SchemaRegistry, validate_resources
+from .uniqueness import UniquenessIndex
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+
+class _JsonStreamReader:
+    """
+    Decode a JSON document value by value from a file object, keeping in memory only what has not been decoded yet
+    """
+
+    def __init__(self, fp: IO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+        # read at least as much as is pending so that a value spanning many chunks is re-scanned a logarithmic number
+        # of times only
+        chunk = self._fp.read(max(self._chunk_size, len(self._buffer) - self._pos))
+        if isinstance(chunk, bytes):
+            chunk = self._utf8_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """
+        :return: the next non-whitespace character (without consuming it) or an empty string at the end of the file
+        """
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return match.group()
+            self._pos = len(self._buffer)
+            if not self._read():
+                return ""
+
+    def consume(self, *expected: str) -> str:
+        char = self.peek()
+        if char not in expected or char == "":
+            raise self._error(
+                "Expecting one of {} but got '{}'".format(" ".join(expected), char)
+            )
+        self._pos += 1
+        return char
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+            # a number at the end of the buffer may be cut short - only trust it once more has been read
+            if end == len(self._buffer) and self._read():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_list_response_resources(fp: IO, chunk_size: int = 65536) -> Iterator[Dict]:
+    """
+    Yield each element of the "Resources" of a ListResponse read incrementally from a file object
+    """
+    reader = _JsonStreamReader(fp, chunk_size)
+    reader.consume("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.decode()
+        reader.consume(":")
+        if key == "Resources":
+            reader.consume("[")
+            if reader.peek() == "]":
+                reader.consume("]")
+            else:
+                while True:
+                    yield reader.decode()
+                    if reader.consume(",", "]") == "]":
+                        break
+        else:
+            reader.decode()
+
+        if reader.consume(",", "}") == "}":
+            return
+
+
+def iter_ndjson_resources(fp: IO) -> Iterator[Dict]:
+    """
+    Yield each resource of a newline delimited JSON file object, skipping blank lines
+    """
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _validate_ndjson_resources(
+    fp: IO,
+    registry: SchemaRegistry,
+    uniqueness_index: Optional[UniquenessIndex],
+) -> Iterator[Tuple[Any, Optional[AssertionError]]]:
+    """
+    Validate each line of a newline delimited JSON file object, skipping blank lines - the lines are independent, so a
+    line which is not valid JSON is reported (with the line itself in place of the resource) and the next lines read
+    """
+    for line_number, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+        try:
+            resource = json.loads(line)
+        except ValueError as ve:
+            yield line.rstrip("\r\n"), AssertionError(
+                "line {} is not valid JSON: {}".format(line_number, ve)
+            )
+            continue
+        (error,) = registry.validate_many(
+            (resource,), uniqueness_index=uniqueness_index
+        )
+        yield resource, error
+
+
+def write_ndjson_resources(resources: Iterable[Dict], fp: IO) -> int:
+    """
+    Write each resource on a line of its own to a text file object, as read by iter_ndjson_resources
+    :return: the number of resources written
+    """
+    count = 0
+    for resource in resources:
+        fp.write(json.dumps(resource, separators=(",", ":")))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def validate_stream(
+    fp: IO,
+    core_schema_definitions: Mapping[str, Model],
+    extension_schema_definitions: Dict[str, Model],
+    ndjson: bool = False,
+    uniqueness_index: Optional[UniquenessIndex] = None,
+) -> Iterator[Tuple[Any, Optional[AssertionError]]]:
+    """
+    Validate the resources of a ListResponse (or of a NDJSON file when ndjson is True) as they are read - a ListResponse
+    which is not valid JSON raises JSONDecodeError, whereas a NDJSON line which is not valid JSON is yielded as
+    (line, AssertionError)
+    :param uniqueness_index: also check the unique attributes of each resource against the resources validated before
+    :return: an iterator yielding (resource, None) for a valid resource or (resource, AssertionError) otherwise
+    """
+    if ndjson:
+        return _validate_ndjson_resources(
+            fp,
+            SchemaRegistry(core_schema_definitions, extension_schema_definitions),
+            uniqueness_index,
+        )
+    resources = iter_list_response_resources(fp)
+    # both sides are consumed in lockstep, so tee only ever holds the current resource
+    resources, validated_resources = tee(resources)
+    return zip(
+        resources,
+        validate_resources(
+            validated_resources,
+            core_schema_definitions,
+            extension_schema_definitions,
+            uniqueness_index=uniqueness_index,
+        ),
+    )
@@ -0,0 +1,108 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from . import scim_exceptions
+from .model import Model, UniqueAttribute
+
+# id is unique across all the resources of a service provider - https://tools.ietf.org/html/rfc7643#section-3.1
+_id_attribute = UniqueAttribute(name="id", uniqueness="global", case_exact=True)
+
+
+class _Field(NamedTuple):
+    extension_id: Optional[str]
+    attribute: UniqueAttribute
+    values: Dict[Any, str]
+    locator: List[str]
+
+
+class UniquenessIndex:
+    """
+    Index of the values of the attributes which must be unique (uniqueness server or global, and id) across a collection
+    of resources, so that each resource added is checked against the resources added before it in constant time.
+    The same index can be passed to successive batches (or streams) to check them as one collection
+    """
+
+    def __init__(self) -> None:
+        # (schema id, attribute name) -> value (lower-cased unless caseExact) -> the resource holding it (its id or its
+        # position in the index)
+        self._indexes: Dict[Tuple[str, str], Dict[Any, str]] = {}
+        # the fields to check for each combination of schemas
+        self._fields: Dict[Tuple[str, ...], List[_Field]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_fields(
+        self, core_meta_schemas: List[Model], extension_meta_schemas: List[Model]
+    ) -> List[_Field]:
+        key = tuple(model.id for model in core_meta_schemas + extension_meta_schemas)
+        try:
+            return self._fields[key]
+        except KeyError:
+            pass
+        fields = [
+            _Field(
+                None, _id_attribute, self._indexes.setdefault(("", "id"), {}), ["id"]
+            )
+        ]
+        for model in core_meta_schemas + extension_meta_schemas:
+            for attribute in model._unique_attributes:
+                fields.append(
+                    _Field(
+                        None if model in core_meta_schemas else model.id,
+                        attribute,
+                        self._indexes.setdefault((model.id, attribute.name), {}),
+                        [model.id, attribute.name],
+                    )
+                )
+        self._fields[key] = fields
+        return fields
+
+    def add(
+        self,
+        data: Dict,
+        core_meta_schemas: List[Model],
+        extension_meta_schemas: List[Model],
+    ) -> None:
+        """
+        Index the unique values of a resource - the values it shares with a resource added before are not indexed again
+        and are reported by an exception raised once the resource has been added
+        """
+        resource_id = data.get("id")
+        resource = (
+            resource_id if isinstance(resource_id, str) else "#{}".format(self._count)
+        )
+        self._count += 1
+        exceptions: List[BaseException] = []
+        for extension_id, attribute, index, locator in self._get_fields(
+            core_meta_schemas, extension_meta_schemas
+        ):
+            values = data if extension_id is None else data.get(extension_id)
+            if not isinstance(values, dict):
+                continue
+            value = values.get(attribute.name)
+            if value is None or isinstance(value, (dict, list)):
+                continue
+            key = (
+                value.lower()
+                if not attribute.case_exact and isinstance(value, str)
+                else value
+            )
+            first_resource = index.get(key)
+            if first_resource is None:
+                index[key] = resource
+            else:
+                exceptions.append(
+                    scim_exceptions.ScimAttributeNotUniqueException(
+                        locator=locator,
+                        value=value,
+                        uniqueness=attribute.uniqueness,
+                        resource=first_resource,
+                    )
+                )
+
+        if len(exceptions) > 0:
+            raise scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                location="Resource '{}' of the collection".format(resource),
+                exceptions=exceptions,
+            )
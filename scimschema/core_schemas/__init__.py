@@ -1,26 +1,155 @@
 import glob
+import hashlib
 import json
 import logging
 import os
+import pickle
+import sys
 from pathlib import Path
-from typing import Dict
+from stat import S_IWGRP, S_IWOTH
+from typing import Dict, Iterator, Mapping, Optional
 
 from .._model.model import Model
 
 scim_logger = logging.getLogger("pyscim")
 
+# compiled models are cached next to the byte code unless SCIMSCHEMA_CACHE_DIR points elsewhere - setting
+# SCIMSCHEMA_NO_CACHE disables the cache
+_cache_dir = os.environ.get("SCIMSCHEMA_CACHE_DIR") or os.path.join(
+    os.path.dirname(__file__), "__pycache__"
+)
+_cache_enabled = not os.environ.get("SCIMSCHEMA_NO_CACHE")
+_source_signature: Optional[str] = None
+
+
+def _get_source_signature() -> str:
+    """
+    Identify the code that builds the models - the package version, the Python version and the model sources
+    """
+    global _source_signature
+    if _source_signature is None:
+        package_dir = os.path.dirname(os.path.dirname(__file__))
+        sources = [os.path.join(package_dir, "VERSION")] + sorted(
+            glob.glob(os.path.join(package_dir, "_model", "*.py"))
+        )
+        _source_signature = "|".join(
+            [sys.version]
+            + [
+                "{}:{}:{}".format(source, stat.st_mtime_ns, stat.st_size)
+                for source, stat in ((source, os.stat(source)) for source in sources)
+            ]
+        )
+    return _source_signature
+
+
+def _get_cache_path(path: str) -> str:
+    stat = os.stat(path)
+    key = "{}|{}:{}:{}".format(
+        _get_source_signature(), os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+    )
+    return os.path.join(
+        _cache_dir,
+        "{}.{}.pickle".format(
+            Path(path).stem, hashlib.sha1(key.encode("utf-8")).hexdigest()
+        ),
+    )
+
+
+def _is_trusted(stat_result: os.stat_result) -> bool:
+    """
+    Loading a pickle can run any code, so only the cache directory and files of the current user which nobody else
+    can write to are used
+    """
+    if hasattr(os, "getuid") and stat_result.st_uid != os.getuid():
+        return False
+    return not stat_result.st_mode & (S_IWGRP | S_IWOTH)
+
+
+def _load_cached(path: str) -> Optional[Model]:
+    try:
+        if not _is_trusted(os.stat(_cache_dir)):
+            scim_logger.debug("Ignoring untrusted schema cache {}".format(_cache_dir))
+            return None
+        with open(_get_cache_path(path), "rb") as f:
+            if not _is_trusted(os.fstat(f.fileno())):
+                scim_logger.debug(
+                    "Ignoring untrusted cached schema for {}".format(path)
+                )
+                return None
+            model = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        scim_logger.debug("Ignoring cached schema for {}: {}".format(path, e))
+        return None
+    return model if isinstance(model, Model) else None
+
+
+def _store_cached(path: str, model: Model) -> None:
+    cache_path = _get_cache_path(path)
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        os.makedirs(_cache_dir, mode=0o700, exist_ok=True)
+        if not _is_trusted(os.stat(_cache_dir)):
+            scim_logger.debug("Not caching schema in untrusted {}".format(_cache_dir))
+            return
+        # drop the caches of previous versions of this schema
+        for stale_path in glob.glob(
+            os.path.join(_cache_dir, "{}.*.pickle".format(glob.escape(Path(path).stem)))
+        ):
+            os.remove(stale_path)
+        # only readable by the current user, and never written through a file (or link) which already exists
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        scim_logger.debug("Could not cache schema for {}: {}".format(path, e))
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# the URN of each core schema and the spec it is loaded from, so that a spec is only loaded once its URN is looked up
+_core_schema_files = {
+    "urn:ietf:params:scim:schemas:core:2.0:User": "SCIM Core2 user spec.json",
+    "urn:ietf:params:scim:schemas:core:2.0:Group": "SCIM Core2 group spec.json",
+    "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": "SCIM Core2 enterpriseuser spec.json",
+    "urn:scim:api:messages:2.0:Error": "SCIM Core2 error spec.json",
+    "urn:ietf:params:scim:schemas:core:2.0:ResourceType": "SCIM Core2 resourcetype spec.json",
+    "urn:ietf:params:scim:schemas:core:2.0:Schema": "SCIM Core2 schema spec.json",
+    "urn:ietf:params:scim:schemas:core:2.0:ServiceProviderConfig": "SCIM Core2 serviceproviderconfig spec.json",
+}
 
-""" 
-    Dynamically load all the json files at the root of this module into a dictionary attribute "schema") 
-    The Key is the name of the json file (without extension)
-    The Value is the json object 
-    E.g. 
-    from core_schemas import core2
-    user_schema = core2.schema["user"]
-"""
+
+def _load_json(path: str) -> Model:
+    try:
+        with open(path) as f:
+            module_name = Path(path).stem
+            scim_logger.debug(
+                "Loading {} by {}.{}".format(
+                    module_name, Model.load.__module__, Model.load.__name__
+                )
+            )
+            return Model.load(f)
+    except json.JSONDecodeError as jde:
+        assert jde is None, "Failed to load example: {} from {}".format(
+            path, __package__
+        )
 
 
-def load_dict(path: str) -> Dict[str, Model]:
+def _load_model(path: str, cache: bool) -> Model:
+    if cache and _cache_enabled:
+        model = _load_cached(path)
+        if model is None:
+            model = _load_json(path)
+            _store_cached(path, model)
+        return model
+    return _load_json(path)
+
+
+def load_dict(path: str, cache: bool = False) -> Dict[str, Model]:
     """
     Dynamically load all the json files at the root of this module into a dictionary attribute "schema")
     The Key is the name of the json file (without extension)
@@ -28,28 +157,59 @@ def load_dict(path: str) -> Dict[str, Model]:
     E.g.
     from core_schemas import core2
     user_schema = core2.schema["user"]
+    :param cache: reuse (or store) the models pickled by a previous load of the same, unchanged, files - unless the
+    SCIMSCHEMA_NO_CACHE environment variable is set
     """
-
-    def load(_path) -> Model:
-        try:
-            with open(_path) as f:
-                module_name = Path(_path).stem
-                scim_logger.debug(
-                    "Loading {} by {}.{}".format(
-                        module_name, Model.load.__module__, Model.load.__name__
-                    )
-                )
-                return Model.load(f)
-        except json.JSONDecodeError as jde:
-            assert jde is None, "Failed to load example: {} from {}".format(
-                _path, __package__
-            )
-
     return {
         _schema.id: _schema
-        for _schema in (load(path) for path in glob.glob(os.path.join(path, "*.json")))
+        for _schema in (
+            _load_model(path, cache) for path in glob.glob(os.path.join(path, "*.json"))
+        )
     }
 
 
+class _LazySchemaDict(Mapping):
+    """
+    Read-only mapping of schema URNs to their models, which loads the spec of a URN when it is first looked up
+    """
+
+    def __init__(self, paths: Dict[str, str], cache: bool = False):
+        self._paths = paths
+        self._cache = cache
+        self._models: Dict[str, Model] = {}
+
+    def __getitem__(self, schema_id: str) -> Model:
+        try:
+            return self._models[schema_id]
+        except KeyError:
+            pass
+        model = _load_model(self._paths[schema_id], self._cache)
+        assert (
+            model.id == schema_id
+        ), "Schema {} was expected to define {} but defines {}".format(
+            self._paths[schema_id], schema_id, model.id
+        )
+        self._models[schema_id] = model
+        return model
+
+    def __contains__(self, schema_id) -> bool:
+        return schema_id in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return "{}(loaded={})".format(self.__class__.__name__, sorted(self._models))
+
+
 scim_logger.debug("Logging scim core schema")
-schema = load_dict(path=os.path.dirname(__file__))
+schema = _LazySchemaDict(
+    paths={
+        schema_id: os.path.join(os.path.dirname(__file__), file_name)
+        for schema_id, file_name in _core_schema_files.items()
+    },
+    cache=True,
+)
@@ -0,0 +1,87 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scimschema import validate_async, validate_many_async
+from scimschema._model import scim_exceptions
+
+from . import examples, extension
+
+invalid_user = {
+    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+    "id": "2819c223-7f76-453a-919d-413861904646",
+}
+
+
+def _run(coroutine):
+    # asyncio.run requires python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _current_task():
+    # asyncio.current_task was added by python 3.7 and Task.current_task removed by 3.9
+    current_task = getattr(asyncio, "current_task", None)
+    if current_task is None:
+        return asyncio.Task.current_task()
+    return current_task()
+
+
+def test_validate_async():
+    _run(
+        validate_async(
+            data=examples.user, extension_schema_definitions=extension.schema
+        )
+    )
+    with pytest.raises(
+        scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions
+    ):
+        _run(
+            validate_async(
+                data=invalid_user, extension_schema_definitions=extension.schema
+            )
+        )
+
+
+def test_validate_many_async_keeps_order():
+    resources = [examples.user, invalid_user, examples.group] * 3
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = _run(
+            validate_many_async(
+                resources=resources,
+                extension_schema_definitions=extension.schema,
+                chunk_size=2,
+                executor=executor,
+            )
+        )
+
+    assert [result is None for result in results] == [True, False, True] * 3
+
+
+def test_validate_many_async_stops_when_cancelled():
+    consumed = []
+
+    async def main():
+        task = _current_task()
+
+        def resources():
+            for resource in [examples.user] * 5:
+                consumed.append(resource)
+                if len(consumed) == 2:
+                    task.cancel()
+                yield resource
+
+        await validate_many_async(
+            resources=resources(),
+            extension_schema_definitions=extension.schema,
+            chunk_size=1,
+        )
+
+    with pytest.raises(asyncio.CancelledError):
+        _run(main())
+    assert len(consumed) == 2
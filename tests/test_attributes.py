@@ -3,7 +3,7 @@ from copy import deepcopy
 
 import pytest
 
-from scimschema._model import attribute, model
+from scimschema._model import attribute, model, scim_exceptions
 
 
 def test_default_meta_attribute():
@@ -196,6 +196,45 @@ def test_datetime_meta_attribute():
     maf.validate(data)
 
 
+@pytest.mark.parametrize(
+    "value, is_valid",
+    [
+        ("2008-01-23T04:56:22Z", True),
+        ("2011-08-01T18:29:49.793Z", True),
+        ("2011-08-01T18:29:49+01:00", True),
+        ("2011-08-01T18:29:49.5-05:30", True),
+        ("2011-08-01T18:29:49", True),
+        ("2016-12-31T23:59:60Z", True),
+        ("2011-02-30T18:29:49Z", False),
+        ("2011-08-01T24:29:49Z", False),
+        ("2011-08-01T18:29:49+15:00", False),
+        ("2011-08-01T18:29:49+14:00", True),
+        ("2011-08-01T18:29:49-14:00", True),
+        ("2011-08-01T18:29:49+14:59", False),
+        ("2011-08-01T18:29:49+14:01", False),
+        ("2016-12-31T23:59:61Z", False),
+        ("2016-12-31T23:59:99Z", False),
+        ("2011-08-01 18:29:49Z", False),
+        ("2011-08-01T18:29:49Z\n", False),
+        ("Invalid date", False),
+        (20110801, False),
+    ],
+)
+def test_datetime_values(value, is_valid):
+    schema = {"name": "lastModified", "type": "dateTime", "required": True}
+    maf = model.AttributeFactory.create(
+        d=schema, locator_path="urn:ietf:params:scim:schemas:test:datetime_attribute"
+    )
+
+    for validate in (maf.validate, maf.compile()):
+        assert_exceptions = None
+        try:
+            validate({"lastModified": value})
+        except AssertionError as ae:
+            assert_exceptions = ae
+        assert (assert_exceptions is None) == is_valid
+
+
 def test_invalid_datetime_meta_attribute():
     schema = {
         "name": "created",
@@ -252,6 +291,19 @@ def test_invalid_decimal_meta_attribute():
     assert re.search(pattern=pattern, string=str(assert_exceptions)) is not None
 
 
+@pytest.mark.parametrize("value", [10, True, "10.5", ".1", 1e20, None])
+def test_invalid_decimal_values(value):
+    schema = {"name": "score", "type": "decimal", "required": True}
+    maf = model.AttributeFactory.create(
+        d=schema, locator_path="urn:ietf:params:scim:schemas:test:decimal_attribute"
+    )
+
+    for validate in (maf.validate, maf.compile()):
+        with pytest.raises(scim_exceptions.ScimAttributeInvalidTypeException):
+            validate({"score": value})
+    maf.compile()({"score": 10.5})
+
+
 def test_string_meta_attribute():
     schema = {"name": "userName", "type": "string", "required": True}
     maf = model.AttributeFactory.create(
@@ -373,7 +425,7 @@ def test_multi_valued_complex_meta_attribute():
             {"value": "bjensen@example.com", "type": "work", "primary": True},
             {"value": "babs@jensen.org", "type": "home"},
             {},
-            {"primary": True},
+            {"primary": False},
         ]
     }
     maf = model.AttributeFactory.create(
@@ -533,3 +585,276 @@ def test_meta_attribute(key, value):
 
 
 # </editor-fold>
+
+
+def test_compiled_attribute_does_not_mutate():
+    schema = {
+        "name": "userName",
+        "type": "string",
+        "multiValued": True,
+        "required": True,
+    }
+    maf = model.AttributeFactory.create(
+        d=schema,
+        locator_path="urn:ietf:params:scim:schemas:test:multi_string_attribute",
+    )
+    validate = maf.compile()
+
+    data = {"userName": ["Superuser"]}
+    validate(data)
+    assert data == {"userName": ["Superuser"]}
+
+    assert_exceptions = None
+    try:
+        validate({})
+    except AssertionError as ae:
+        assert_exceptions = ae
+    assert "'Multi-value attribute:userName' is required" in str(assert_exceptions)
+
+
+def test_compiled_complex_attribute_invalid_type():
+    schema = {
+        "name": "name",
+        "type": "complex",
+        "subAttributes": [{"name": "givenName", "type": "string"}],
+    }
+    maf = model.AttributeFactory.create(
+        d=schema, locator_path="urn:ietf:params:scim:schemas:test:complex_attribute"
+    )
+    assert_exceptions = None
+    try:
+        maf.compile()({"name": "Barbara"})
+    except AssertionError as ae:
+        assert_exceptions = ae
+    assert "is expected to be 'complex'" in str(assert_exceptions)
+
+
+def test_absent_optional_attribute_does_not_build_exception(monkeypatch):
+    schema = {"name": "nickName", "type": "string", "required": False}
+    maf = model.AttributeFactory.create(
+        d=schema, locator_path="urn:ietf:params:scim:schemas:test:string_attribute"
+    )
+
+    def fail(d):
+        raise NotImplementedError("absent optional attribute must not build exception")
+
+    monkeypatch.setattr(maf, "_value_not_found", fail)
+    maf.validate({"userName": "Superuser"})
+    maf.compile()({"userName": "Superuser"})
+
+
+@pytest.mark.parametrize(
+    "case_exact, value, is_valid",
+    [
+        (False, "WORK", True),
+        (False, "other", True),
+        (True, "Work", False),
+        (True, "work", True),
+    ],
+)
+def test_canonical_values_string_attribute(case_exact, value, is_valid):
+    schema = {
+        "name": "type",
+        "type": "string",
+        "caseExact": case_exact,
+        "canonicalValues": ["work", "home", "other"],
+    }
+    maf = model.AttributeFactory.create(
+        d=schema, locator_path="urn:ietf:params:scim:schemas:test:string_attribute"
+    )
+    assert isinstance(maf._canonical_values, frozenset)
+
+    for validate in (maf.validate, maf.compile()):
+        assert_exceptions = None
+        try:
+            validate({"type": value})
+        except AssertionError as ae:
+            assert_exceptions = ae
+        assert (assert_exceptions is None) == is_valid
+        if not is_valid:
+            assert "is expected to be 'one of work ,home ,other'" in str(
+                assert_exceptions
+            )
+
+
+_unique_emails_schema = {
+    "name": "emails",
+    "type": "complex",
+    "multiValued": True,
+    "uniqueness": "server",
+    "subAttributes": [
+        {"name": "value", "type": "string", "caseExact": False},
+        {"name": "type", "type": "string", "caseExact": False},
+        {"name": "primary", "type": "boolean"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "emails, duplicates",
+    [
+        (
+            [
+                {"value": "bjensen@example.com", "type": "work"},
+                {"value": "babs@jensen.org", "type": "home"},
+            ],
+            None,
+        ),
+        (
+            [
+                {"value": "bjensen@example.com", "type": "work"},
+                {"value": "BJensen@Example.com", "type": "Work"},
+                {"value": "bjensen@example.com", "type": "WORK"},
+            ],
+            ["BJensen@Example.com"],
+        ),
+        (
+            [
+                {"value": "bjensen@example.com", "type": "work"},
+                {"value": "bjensen@example.com", "type": "home"},
+            ],
+            None,
+        ),
+        ([{"type": "work"}, {"type": "work"}], None),
+        (
+            [{"value": {"a": [1, 2]}, "type": "work"}] * 2
+            + [{"value": [1, {"a": 2}]}] * 2,
+            [{"a": [1, 2]}, [1, {"a": 2}]],
+        ),
+    ],
+)
+def test_multi_valued_complex_duplicate_values(emails, duplicates):
+    maf = model.AttributeFactory.create(
+        d=deepcopy(_unique_emails_schema),
+        locator_path="urn:ietf:params:scim:schemas:test:multi_complex_attribute",
+    )
+    for validate in (maf.validate, maf.compile()):
+        assert_exceptions = None
+        try:
+            validate({"emails": emails})
+        except AssertionError as ae:
+            assert_exceptions = ae
+        if duplicates is None:
+            assert not any(
+                isinstance(e, scim_exceptions.ScimAttributeDuplicateValueException)
+                for e in getattr(assert_exceptions, "exceptions", [])
+            )
+        else:
+            duplicate_exception = assert_exceptions.exceptions[0]
+            assert isinstance(
+                duplicate_exception,
+                scim_exceptions.ScimAttributeDuplicateValueException,
+            )
+            assert duplicate_exception.value == duplicates
+
+
+@pytest.mark.parametrize(
+    "case_exact, values, duplicates",
+    [
+        (False, ["Admin", "admin", "user", "ADMIN"], ["admin"]),
+        (True, ["Admin", "admin", "user"], None),
+        (True, ["Admin", "user", "Admin"], ["Admin"]),
+    ],
+)
+def test_multi_valued_string_duplicate_values(case_exact, values, duplicates):
+    schema = {
+        "name": "roles",
+        "type": "string",
+        "multiValued": True,
+        "caseExact": case_exact,
+        "uniqueness": "server",
+    }
+    maf = model.AttributeFactory.create(
+        d=schema, locator_path="urn:ietf:params:scim:schemas:test:multi_string"
+    )
+    for validate in (maf.validate, maf.compile()):
+        assert_exceptions = None
+        try:
+            validate({"roles": values})
+        except AssertionError as ae:
+            assert_exceptions = ae
+        if duplicates is None:
+            assert assert_exceptions is None
+        else:
+            assert assert_exceptions.exceptions[0].value == duplicates
+
+
+def test_multi_valued_duplicate_values_is_first_with_max_errors():
+    maf = model.AttributeFactory.create(
+        d=deepcopy(_unique_emails_schema),
+        locator_path="urn:ietf:params:scim:schemas:test:multi_complex_attribute",
+    )
+    emails = [{"value": "bjensen@example.com"}] * 2 + [{"value": 1}, {"value": 2}]
+    assert_exceptions = None
+    try:
+        maf.compile()({"emails": emails}, scim_exceptions.ErrorBudget(2))
+    except AssertionError as ae:
+        assert_exceptions = ae
+    assert [type(e).__name__ for e in assert_exceptions.exceptions] == [
+        "ScimAttributeDuplicateValueException",
+        "AggregatedScimMultValueAttributeValidationExceptions",
+    ]
+
+
+@pytest.mark.parametrize(
+    "emails, primaries",
+    [
+        (
+            [
+                {"value": "bjensen@example.com", "primary": True},
+                {"value": "babs@jensen.org", "primary": False},
+                {"value": "barbara@example.com"},
+            ],
+            None,
+        ),
+        (
+            [
+                {"value": "bjensen@example.com", "primary": True},
+                {"value": "babs@jensen.org", "primary": True},
+                {"value": "barbara@example.com", "primary": True},
+            ],
+            ["bjensen@example.com", "babs@jensen.org", "barbara@example.com"],
+        ),
+    ],
+)
+def test_multi_valued_complex_primary_values(emails, primaries):
+    maf = model.AttributeFactory.create(
+        d=deepcopy(_unique_emails_schema),
+        locator_path="urn:ietf:params:scim:schemas:test:multi_complex_attribute",
+    )
+    for validate in (maf.validate, maf.compile()):
+        assert_exceptions = None
+        try:
+            validate({"emails": emails})
+        except AssertionError as ae:
+            assert_exceptions = ae
+        if primaries is None:
+            assert assert_exceptions is None
+        else:
+            (primary_exception,) = assert_exceptions.exceptions
+            assert isinstance(
+                primary_exception,
+                scim_exceptions.ScimAttributeInvalidPrimaryPropertyException,
+            )
+            assert primary_exception.value == primaries
+            assert [e.code for e in primary_exception.errors()] == ["primary"]
+
+
+def test_multi_valued_primary_values_follow_duplicate_values():
+    maf = model.AttributeFactory.create(
+        d=deepcopy(_unique_emails_schema),
+        locator_path="urn:ietf:params:scim:schemas:test:multi_complex_attribute",
+    )
+    emails = [{"value": 1, "primary": True}, {"value": "a@example.com"}] + [
+        {"value": "b@example.com", "primary": True}
+    ] * 2
+    assert_exceptions = None
+    try:
+        maf.compile()({"emails": emails})
+    except AssertionError as ae:
+        assert_exceptions = ae
+    assert [type(e).__name__ for e in assert_exceptions.exceptions] == [
+        "ScimAttributeDuplicateValueException",
+        "ScimAttributeInvalidPrimaryPropertyException",
+        "AggregatedScimMultValueAttributeValidationExceptions",
+    ]
@@ -0,0 +1,117 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+from scimschema import core_schemas, validate
+
+from . import extension
+
+
+def test_load_dict_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(core_schemas, "_cache_dir", str(tmp_path / "cache"))
+    schema_dir = tmp_path / "schemas"
+    shutil.copytree(os.path.dirname(extension.__file__), str(schema_dir))
+
+    loaded = core_schemas.load_dict(path=str(schema_dir), cache=True)
+    cached_files = sorted(os.listdir(str(tmp_path / "cache")))
+    assert len(cached_files) == len(loaded) == 3
+
+    def fail(_path):
+        raise NotImplementedError("expected the cached models to be loaded")
+
+    monkeypatch.setattr(core_schemas.Model, "load", fail)
+    reloaded = core_schemas.load_dict(path=str(schema_dir), cache=True)
+    assert reloaded.keys() == loaded.keys()
+    custom_schema = reloaded["urn:scim:my:custom:schema"]
+    assert [a.name for a in custom_schema.attributes] == ["customName"]
+    custom_schema.compile()({"customName": "custom"})
+
+
+def test_load_dict_cache_is_invalidated(tmp_path, monkeypatch):
+    monkeypatch.setattr(core_schemas, "_cache_dir", str(tmp_path / "cache"))
+    schema_dir = tmp_path / "schemas"
+    shutil.copytree(os.path.dirname(extension.__file__), str(schema_dir))
+    core_schemas.load_dict(path=str(schema_dir), cache=True)
+    cached_files = set(os.listdir(str(tmp_path / "cache")))
+
+    custom_spec = str(schema_dir / "SCIM_Custom_spec.json")
+    stat = os.stat(custom_spec)
+    os.utime(custom_spec, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    core_schemas.load_dict(path=str(schema_dir), cache=True)
+
+    new_cached_files = set(os.listdir(str(tmp_path / "cache")))
+    assert len(new_cached_files) == 3
+    changed_files = new_cached_files - cached_files
+    assert len(changed_files) == 1
+    assert changed_files.pop().startswith("SCIM_Custom_spec.")
+
+
+def test_load_dict_cache_is_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(core_schemas, "_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(core_schemas, "_cache_enabled", False)
+    core_schemas.load_dict(path=os.path.dirname(extension.__file__), cache=True)
+    assert not os.path.exists(str(tmp_path / "cache"))
+
+
+@pytest.mark.parametrize("untrusted", ["directory", "file", "owner"])
+def test_load_dict_cache_is_not_trusted(tmp_path, monkeypatch, untrusted):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(core_schemas, "_cache_dir", str(cache_dir))
+    schema_dir = os.path.dirname(extension.__file__)
+    loaded = core_schemas.load_dict(path=schema_dir, cache=True)
+    assert oct(os.stat(str(cache_dir)).st_mode & 0o777) == oct(0o700)
+
+    if untrusted == "directory":
+        os.chmod(str(cache_dir), 0o777)
+    elif untrusted == "file":
+        for cached_file in os.listdir(str(cache_dir)):
+            os.chmod(str(cache_dir / cached_file), 0o666)
+    else:
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+    calls = []
+    load = core_schemas.Model.load
+
+    def count_load(f):
+        calls.append(f)
+        return load(f)
+
+    monkeypatch.setattr(core_schemas.Model, "load", count_load)
+    reloaded = core_schemas.load_dict(path=schema_dir, cache=True)
+    assert reloaded.keys() == loaded.keys()
+    assert len(calls) == len(loaded)
+
+
+def test_core_schema_files_match_specs():
+    loaded = core_schemas.load_dict(path=os.path.dirname(core_schemas.__file__))
+    assert sorted(core_schemas.schema) == sorted(loaded)
+    for schema_id, model in core_schemas.schema.items():
+        assert model.id == schema_id
+
+
+def test_core_schemas_are_loaded_on_first_access(monkeypatch):
+    user_schema_id = "urn:ietf:params:scim:schemas:core:2.0:User"
+    lazy_schema = core_schemas._LazySchemaDict(
+        paths=core_schemas.schema._paths, cache=False
+    )
+    monkeypatch.setattr(core_schemas, "schema", lazy_schema)
+
+    assert user_schema_id in lazy_schema
+    assert "urn:unknown" not in lazy_schema
+    assert len(lazy_schema) == 7
+    assert lazy_schema._models == {}
+
+    validate(
+        data={"schemas": [user_schema_id], "id": "1", "userName": "bjensen"},
+        extension_schema_definitions={},
+    )
+    assert list(lazy_schema._models) == [user_schema_id]
+    assert lazy_schema[user_schema_id] is lazy_schema[user_schema_id]
+
+    unpickled_schema = pickle.loads(pickle.dumps(lazy_schema))
+    assert list(unpickled_schema._models) == [user_schema_id]
+    with pytest.raises(KeyError):
+        lazy_schema["urn:unknown"]
@@ -0,0 +1,106 @@
+import io
+
+import pytest
+
+from scimschema import (
+    UniquenessIndex,
+    core_schemas,
+    generate_resources,
+    validate_many,
+    validate_stream,
+    write_ndjson,
+)
+from scimschema._model.generator import ResourceGenerator
+
+from . import extension
+
+user_schema_id = "urn:ietf:params:scim:schemas:core:2.0:User"
+group_schema_id = "urn:ietf:params:scim:schemas:core:2.0:Group"
+
+
+@pytest.mark.parametrize(
+    "schemas",
+    [
+        [user_schema_id],
+        [group_schema_id],
+        ["urn:ietf:params:scim:schemas:core:2.0:Schema"],
+        ["urn:ietf:params:scim:schemas:core:2.0:ServiceProviderConfig"],
+        [user_schema_id] + list(extension.schema),
+    ],
+)
+@pytest.mark.parametrize("optional_ratio", [0.0, 0.5, 1.0])
+def test_generate_valid_resources(schemas, optional_ratio):
+    resources = list(
+        generate_resources(
+            schemas,
+            extension.schema,
+            count=50,
+            fan_out=3,
+            optional_ratio=optional_ratio,
+        )
+    )
+    assert len(resources) == 50
+    assert all(resource["schemas"] == schemas for resource in resources)
+    assert (
+        validate_many(resources, extension.schema, uniqueness_index=UniquenessIndex())
+        == [None] * 50
+    )
+
+
+def test_generate_invalid_resources():
+    resources = list(
+        generate_resources([user_schema_id], {}, count=200, invalid_ratio=0.5)
+    )
+    invalid_count = sum(result is not None for result in validate_many(resources, {}))
+    assert 50 < invalid_count < 150
+
+    resources = generate_resources([group_schema_id], {}, count=20, invalid_ratio=1.0)
+    assert None not in validate_many(resources, {})
+
+
+def test_generate_resources_is_deterministic():
+    resources = list(generate_resources([user_schema_id], {}, count=10, seed=1))
+    assert resources == list(generate_resources([user_schema_id], {}, count=10, seed=1))
+    assert resources != list(generate_resources([user_schema_id], {}, count=10, seed=2))
+    # each resource only depends on the seed and its index
+    assert resources[5:] == list(
+        generate_resources([user_schema_id], {}, count=5, start=5, seed=1)
+    )
+
+
+def test_generate_resources_fan_out():
+    (group,) = generate_resources(
+        [group_schema_id],
+        {},
+        fan_out_by_attribute={"Members": 1000},
+        optional_ratio=1.0,
+    )
+    assert len(group["members"]) == 1000
+    assert len({member["value"] for member in group["members"]}) == 1000
+
+    for user in generate_resources(
+        [user_schema_id], {}, count=20, fan_out=4, optional_ratio=1.0
+    ):
+        assert 1 <= len(user["emails"]) <= 4
+        assert sum(email.get("primary") is True for email in user["emails"]) == 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"fan_out": 0}, {"optional_ratio": 1.5}, {"invalid_ratio": -0.1}],
+)
+def test_resource_generator_invalid_options(options):
+    with pytest.raises(ValueError):
+        ResourceGenerator(core_schemas.schema[user_schema_id], **options)
+
+
+def test_write_ndjson():
+    resources = list(generate_resources([user_schema_id], {}, count=20))
+    fp = io.StringIO()
+    assert write_ndjson(resources, fp) == 20
+    assert fp.getvalue().count("\n") == 20
+
+    fp.seek(0)
+    results = list(validate_stream(fp, {}, ndjson=True))
+    assert [resource for resource, _ in results] == resources
+    assert [error for _, error in results] == [None] * 20
@@ -1,5 +1,7 @@
 import re
 
+import pytest
+
 from scimschema._model import model
 
 # </editor-fold># <editor-fold desc="test meta schema">
@@ -83,3 +85,79 @@ def test_meta_schema_invalid_description():
 
 
 # </editor-fold>
+
+
+# <editor-fold desc="test compiled schema">
+def test_compiled_model_is_reused():
+    from scimschema import core_schemas
+
+    user_model = core_schemas.schema["urn:ietf:params:scim:schemas:core:2.0:User"]
+    assert user_model.compile() is user_model.compile()
+
+
+def test_compiled_model_matches_validate():
+    from scimschema import core_schemas
+
+    user_model = core_schemas.schema["urn:ietf:params:scim:schemas:core:2.0:User"]
+    invalid_user = {
+        "userName": "bjensen",
+        "emails": [{"value": "bjensen@example.com", "type": "unknown"}],
+    }
+    errors = []
+    for validate in (user_model.validate, user_model.compile()):
+        try:
+            validate(invalid_user)
+        except AssertionError as ae:
+            errors.append(str(ae))
+
+    assert len(errors) == 2
+    assert errors[0] == errors[1]
+    assert "is expected to be 'one of work ,home ,other'" in errors[0]
+
+
+@pytest.mark.parametrize(
+    "invalid_user",
+    [
+        {"userName": "bjensen", "name": "Barbara Jensen"},
+        {"userName": "bjensen", "emails": ["bjensen@example.com"]},
+    ],
+)
+def test_complex_attribute_value_is_not_a_string(invalid_user):
+    from scimschema import core_schemas
+
+    user_model = core_schemas.schema["urn:ietf:params:scim:schemas:core:2.0:User"]
+    for validate in (user_model.validate, user_model.compile()):
+        with pytest.raises(AssertionError) as ae:
+            validate(invalid_user)
+        assert "is expected to be 'complex'" in str(ae.value)
+
+
+# </editor-fold>
+
+
+# <editor-fold desc="test attribute index">
+def test_get_attribute():
+    from scimschema import core_schemas
+
+    user_schema_id = "urn:ietf:params:scim:schemas:core:2.0:User"
+    user_model = core_schemas.schema[user_schema_id]
+    name = user_model.get_attribute("NAME")
+    assert (
+        name
+        is user_model.attributes[[a.name for a in user_model.attributes].index("name")]
+    )
+    assert name is user_model.get_attribute(user_schema_id + ":name")
+
+    given_name = user_model.get_attribute("name.givenName")
+    assert given_name.name == "givenName"
+    assert given_name is user_model.get_attribute(
+        user_schema_id.lower() + ":NAME.givenname"
+    )
+    assert user_model.get_attribute("emails.value").name == "value"
+
+    assert user_model.get_attribute("unknown") is None
+    assert user_model.get_attribute("givenName") is None
+    assert user_model.get_attribute("name.givenName.unknown") is None
+
+
+# </editor-fold>
@@ -0,0 +1,118 @@
+import pytest
+
+from scimschema import enforce_mutability
+from scimschema._model import scim_exceptions
+from scimschema._model.model import Model
+from scimschema._model.mutability import enforce_mutability as enforce_model
+
+from . import examples
+
+device_schema_id = "urn:test:schemas:Device"
+
+
+def get_device_model():
+    return Model(
+        {
+            "id": device_schema_id,
+            "name": "Device",
+            "attributes": [
+                {"name": "label", "type": "string"},
+                {"name": "serial", "type": "string", "mutability": "readOnly"},
+                {"name": "owner", "type": "string", "mutability": "immutable"},
+                {
+                    "name": "location",
+                    "type": "complex",
+                    "subAttributes": [
+                        {"name": "room", "type": "string"},
+                        {"name": "site", "type": "string", "mutability": "immutable"},
+                        {"name": "code", "type": "string", "mutability": "readOnly"},
+                    ],
+                },
+            ],
+        }
+    )
+
+
+def test_mutability_rules():
+    rules = get_device_model()._mutability_rules
+    assert [(r.name, r.sub_name, r.mutability) for r in rules] == [
+        ("serial", None, "readOnly"),
+        ("owner", None, "immutable"),
+        ("location", "site", "immutable"),
+        ("location", "code", "readOnly"),
+    ]
+
+
+def test_enforce_mutability_strips_read_only():
+    device = {
+        "schemas": [device_schema_id],
+        "id": "1",
+        "label": "printer",
+        "serial": "X1",
+        "owner": "bjensen",
+        "location": {"room": "1", "site": "London", "code": "L1"},
+    }
+    body = enforce_model(device, get_device_model(), [])
+    assert body == {
+        "schemas": [device_schema_id],
+        "label": "printer",
+        "owner": "bjensen",
+        "location": {"room": "1", "site": "London"},
+    }
+    assert device["location"]["code"] == "L1"
+
+    # immutable values may change case if not caseExact, but may not change once set
+    stored = dict(device, owner="BJensen", location={"site": "Paris"})
+    with pytest.raises(AssertionError) as excinfo:
+        enforce_model(device, get_device_model(), [], stored=stored)
+    errors = scim_exceptions.get_errors(excinfo.value)
+    assert [(e.path, e.code, e.scim_type) for e in errors] == [
+        ((device_schema_id, "location", "site"), "mutability", "mutability")
+    ]
+
+
+def test_enforce_mutability_ignores_the_case_of_names():
+    device = {
+        "schemas": [device_schema_id],
+        "ID": "1",
+        "Serial": "X1",
+        "SERIAL": "X2",
+        "Owner": "bjensen",
+        "Location": {"Room": "1", "Code": "L1"},
+    }
+    body = enforce_model(device, get_device_model(), [])
+    assert body == {
+        "schemas": [device_schema_id],
+        "Owner": "bjensen",
+        "Location": {"Room": "1"},
+    }
+
+    stored = {"owner": "ajensen", "location": {"SITE": "Paris"}}
+    device = dict(body, Location={"Site": "London"})
+    with pytest.raises(AssertionError) as excinfo:
+        enforce_model(device, get_device_model(), [], stored=stored)
+    errors = scim_exceptions.get_errors(excinfo.value)
+    assert [e.path for e in errors] == [
+        (device_schema_id, "owner"),
+        (device_schema_id, "location", "site"),
+    ]
+
+
+def test_enforce_mutability_rejects_read_only():
+    device = {"schemas": [device_schema_id], "serial": "X1", "owner": "bjensen"}
+    with pytest.raises(
+        scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions
+    ):
+        enforce_model(device, get_device_model(), [], strip_read_only=False)
+
+    body = enforce_model(
+        device, get_device_model(), [], stored=device, strip_read_only=False
+    )
+    assert body == device
+
+
+def test_enforce_mutability_core_schema():
+    user = dict(examples.user, groups=[{"value": "e9e30dba", "display": "Tour Guides"}])
+    body = enforce_mutability(user, extension_schema_definitions={})
+    assert "groups" not in body and "id" not in body and "meta" not in body
+    assert body["userName"] == "bjensen"
@@ -0,0 +1,53 @@
+import pickle
+
+from scimschema import core_schemas, validate_parallel
+from scimschema._model import scim_exceptions
+
+from . import extension
+
+
+def test_validate_parallel_keeps_order():
+    from . import examples
+
+    invalid_user = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "id": "2819c223-7f76-453a-919d-413861904646",
+    }
+    resources = [examples.user, invalid_user, examples.group] * 3
+
+    results = validate_parallel(
+        resources=resources,
+        extension_schema_definitions=extension.schema,
+        max_workers=2,
+        chunk_size=2,
+    )
+
+    assert len(results) == len(resources)
+    for i, result in enumerate(results):
+        if i % 3 == 1:
+            assert isinstance(
+                result,
+                scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions,
+            )
+            assert "'Single-value attribute:userName' is required" in str(result)
+        else:
+            assert result is None
+
+
+def test_model_and_exception_pickle():
+    user_model = core_schemas.schema["urn:ietf:params:scim:schemas:core:2.0:User"]
+    user_model.compile()
+    unpickled_model = pickle.loads(pickle.dumps(user_model))
+    unpickled_model.compile()({"userName": "bjensen"})
+
+    exception = scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+        location="Scim response",
+        exceptions=[
+            scim_exceptions.ScimAttributeDuplicateValueException(
+                locator=["emails"], value=["bjensen@example.com"]
+            )
+        ],
+    )
+    unpickled_exception = pickle.loads(pickle.dumps(exception))
+    assert type(unpickled_exception) is type(exception)
+    assert str(unpickled_exception) == str(exception)
@@ -0,0 +1,137 @@
+import pickle
+
+import pytest
+
+from scimschema import validate_patch
+from scimschema._model import scim_exceptions
+from scimschema._model.patch import resolve_path
+from scimschema._model.schema_response import get_meta_schemas
+
+from . import extension
+
+user_schema_id = "urn:ietf:params:scim:schemas:core:2.0:User"
+group_schema_id = "urn:ietf:params:scim:schemas:core:2.0:Group"
+account_schema_id = "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount"
+patch_op_schema = "urn:ietf:params:scim:api:messages:2.0:PatchOp"
+
+
+def patch(*operations):
+    return {"schemas": [patch_op_schema], "Operations": list(operations)}
+
+
+def get_patch_errors(data, schemas):
+    try:
+        validate_patch(
+            data=data, schemas=schemas, extension_schema_definitions=extension.schema
+        )
+    except AssertionError as ae:
+        return scim_exceptions.get_errors(ae)
+    return []
+
+
+@pytest.mark.parametrize(
+    "path, attribute_name, sub_attribute_name, filtered",
+    [
+        ("userName", "userName", None, False),
+        ("NAME.givenName", "name", "givenName", False),
+        ('emails[type eq "work"]', "emails", None, True),
+        ('emails[type eq "work" and value co "]"].value', "emails", "value", True),
+        (user_schema_id + ":name.familyName", "name", "familyName", False),
+        (account_schema_id + ":status", "status", None, False),
+        ("externalId", None, None, False),
+    ],
+)
+def test_resolve_path(path, attribute_name, sub_attribute_name, filtered):
+    from scimschema import core_schemas
+
+    (core_meta_schema,), extension_meta_schemas = get_meta_schemas(
+        [user_schema_id, account_schema_id], core_schemas.schema, extension.schema
+    )
+    target = resolve_path(path, core_meta_schema, extension_meta_schemas)
+    assert getattr(target.attribute, "name", None) == attribute_name
+    assert getattr(target.sub_attribute, "name", None) == sub_attribute_name
+    assert target.filtered is filtered
+
+
+def test_validate_patch():
+    data = patch(
+        {
+            "op": "add",
+            "path": "members",
+            "value": [{"value": "2819c223-7f76-453a-919d-413861904646"}],
+        },
+        {"op": "Replace", "path": "displayName", "value": "Tour Guides"},
+        {"op": "remove", "path": 'members[value eq "2819c223"]'},
+        {"op": "replace", "value": {"displayName": "Guides"}},
+    )
+    assert get_patch_errors(data, [group_schema_id]) == []
+
+    data = patch(
+        {"op": "replace", "path": "name.givenName", "value": "Barbara"},
+        {
+            "op": "add",
+            "path": 'emails[type eq "work"]',
+            "value": {"value": "bjensen@example.com"},
+        },
+        {"op": "replace", "path": account_schema_id + ":status", "value": "active"},
+        {"op": "replace", "path": account_schema_id, "value": {"status": "active"}},
+        {"op": "add", "value": {account_schema_id: {"status": "active"}}},
+        {"op": "replace", "path": "externalId", "value": "bjensen"},
+    )
+    assert get_patch_errors(data, [user_schema_id, account_schema_id]) == []
+
+
+@pytest.mark.parametrize(
+    "operation, code, path",
+    [
+        ({"op": "move", "path": "displayName"}, "invalidOperation", "op"),
+        ({"op": "remove"}, "invalidOperation", "path"),
+        ({"op": "add", "path": "displayName"}, "invalidOperation", "value"),
+        ({"op": "add", "path": "unknown", "value": 1}, "invalidPath", "path"),
+        (
+            {"op": "add", "path": "displayName[x eq 1]", "value": 1},
+            "invalidPath",
+            "path",
+        ),
+        ({"op": "add", "path": "members.unknown", "value": 1}, "invalidPath", "path"),
+        ({"op": "add", "path": "displayName", "value": 1}, "invalidType", None),
+        (
+            {"op": "add", "path": "members", "value": {"value": "1"}},
+            "invalidType",
+            None,
+        ),
+        ({"op": "replace", "value": {"displayName": 1}}, "invalidType", None),
+    ],
+)
+def test_validate_patch_invalid_operation(operation, code, path):
+    errors = get_patch_errors(patch(operation), [group_schema_id])
+    assert [error.code for error in errors] == [code]
+    if path is not None:
+        assert errors[0].path == ("Operations[0]", path)
+
+
+def test_validate_patch_invalid_request():
+    with pytest.raises(AssertionError, match="must specify the schema"):
+        validate_patch(
+            data={"Operations": []},
+            schemas=[group_schema_id],
+            extension_schema_definitions={},
+        )
+    errors = get_patch_errors({"schemas": [patch_op_schema]}, [group_schema_id])
+    assert [error.code for error in errors] == ["invalidOperation"]
+
+
+def test_validate_patch_reuses_value_validators():
+    from scimschema import core_schemas
+
+    group_model = core_schemas.schema[group_schema_id]
+    display_name = next(a for a in group_model.attributes if a.name == "displayName")
+    data = patch({"op": "replace", "path": "displayName", "value": "Tour Guides"})
+
+    assert get_patch_errors(data, [group_schema_id]) == []
+    validate_value = display_name._get_value_validator()
+    assert get_patch_errors(data, [group_schema_id]) == []
+    assert display_name._get_value_validator() is validate_value
+
+    unpickled_model = pickle.loads(pickle.dumps(group_model))
+    unpickled_model.compile()({"displayName": "Tour Guides"})
@@ -0,0 +1,82 @@
+import pytest
+
+from scimschema import SchemaRegistry, core_schemas, project
+
+from . import examples, extension
+
+custom_schema_id = "urn:scim:my:custom:schema"
+
+
+def test_project_default():
+    user = dict(examples.customUser, password="t1meMa$heen")
+    projected = project(user, extension_schema_definitions=extension.schema)
+    # password is never returned and customName only when requested
+    assert projected == {
+        k: v for k, v in examples.customUser.items() if k != custom_schema_id
+    }
+
+
+def test_project_attributes():
+    projected = project(
+        examples.customUser,
+        extension_schema_definitions=extension.schema,
+        attributes="userName, NAME.givenName,emails.value,externalId",
+    )
+    assert projected == {
+        "schemas": examples.customUser["schemas"],
+        "id": examples.customUser["id"],
+        "externalId": "bjensen",
+        "userName": "bjensen",
+        "name": {"givenName": "Barbara"},
+        "emails": [{"value": "bjensen@example.com"}],
+    }
+
+    projected = project(
+        examples.customUser,
+        extension_schema_definitions=extension.schema,
+        attributes=["name", custom_schema_id + ":customName"],
+    )
+    assert projected == {
+        "schemas": examples.customUser["schemas"],
+        "id": examples.customUser["id"],
+        "name": examples.customUser["name"],
+        custom_schema_id: {"customName": "Bard of Avon"},
+    }
+
+
+def test_project_excluded_attributes():
+    projected = project(
+        examples.customUser,
+        extension_schema_definitions=extension.schema,
+        excluded_attributes=["meta", "name.familyName", "id", custom_schema_id],
+    )
+    expected = {
+        k: v
+        for k, v in examples.customUser.items()
+        if k not in ("meta", custom_schema_id)
+    }
+    expected["name"] = {
+        k: v for k, v in examples.customUser["name"].items() if k != "familyName"
+    }
+    assert projected == expected
+
+    with pytest.raises(ValueError):
+        project(
+            examples.customUser,
+            extension_schema_definitions=extension.schema,
+            attributes="userName",
+            excluded_attributes="name",
+        )
+
+
+def test_projection_plan_is_cached():
+    registry = SchemaRegistry(core_schemas.schema, extension.schema)
+    schemas = examples.customUser["schemas"]
+    plan = registry.get_projection_plan(schemas, attributes="userName")
+    assert registry.get_projection_plan(schemas, attributes=["userName"]) is plan
+    assert registry.get_projection_plan(schemas) is not plan
+    assert registry.project(examples.customUser, attributes="userName") == {
+        "schemas": schemas,
+        "id": examples.customUser["id"],
+        "userName": "bjensen",
+    }
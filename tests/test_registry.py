@@ -0,0 +1,130 @@
+import pytest
+
+from scimschema import SchemaRegistry, core_schemas
+
+from . import extension
+
+user_schema_id = "urn:ietf:params:scim:schemas:core:2.0:User"
+account_schema_id = "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount"
+
+
+def test_resolve_is_cached_per_schemas_combination():
+    registry = SchemaRegistry(core_schemas.schema, extension.schema)
+
+    meta_schemas = registry.resolve([user_schema_id, account_schema_id])
+    assert meta_schemas == (
+        [core_schemas.schema[user_schema_id]],
+        [extension.schema[account_schema_id]],
+    )
+    assert registry.resolve((user_schema_id, account_schema_id)) is meta_schemas
+    assert registry.resolve([user_schema_id]) is not meta_schemas
+
+
+def test_resolve_repeated_schemas(monkeypatch):
+    from scimschema._model import registry as registry_module
+
+    monkeypatch.setattr(registry_module, "_meta_schemas_cache_size", 3)
+    registry = SchemaRegistry(core_schemas.schema, extension.schema)
+
+    for count in range(1, 10):
+        core_meta_schemas, extension_meta_schemas = registry.resolve(
+            [user_schema_id] + [account_schema_id] * count
+        )
+        assert extension_meta_schemas == [extension.schema[account_schema_id]]
+    assert len(registry._meta_schemas) == 3
+
+    data = {"schemas": [user_schema_id, account_schema_id, account_schema_id]}
+    data[account_schema_id] = {}
+    with pytest.raises(AssertionError) as excinfo:
+        registry.validate(data)
+    assert str(excinfo.value).count("ipRestrictionsEnabled' is required") == 1
+
+
+@pytest.mark.parametrize(
+    "schemas, message",
+    [
+        (None, "Response has no specified schema"),
+        ([account_schema_id], "Response must specify exactly one core schema"),
+        ([user_schema_id, "urn:unknown"], "Response has unknown schema - urn:unknown"),
+    ],
+)
+def test_resolve_invalid_schemas(schemas, message):
+    registry = SchemaRegistry(core_schemas.schema, extension.schema)
+    with pytest.raises(AssertionError, match=message):
+        registry.resolve(schemas)
+
+
+def test_register_and_validate():
+    from . import examples
+
+    registry = SchemaRegistry(core_schemas.schema)
+    custom_schema_id = "urn:scim:my:custom:schema"
+    assert custom_schema_id not in registry
+    with pytest.raises(AssertionError, match="unknown schema"):
+        registry.validate(examples.customUser)
+
+    registry.register(extension.schema[custom_schema_id])
+    assert custom_schema_id in registry
+    assert registry.get_model(custom_schema_id) is extension.schema[custom_schema_id]
+    registry.validate(examples.customUser)
+
+    results = list(registry.validate_many([examples.customUser, "not a resource"]))
+    assert results[0] is None
+    assert "Resource must be a JSON object" in str(results[1])
+
+
+def test_validate_result_cache():
+    from . import examples
+
+    invalid_user = {"schemas": [user_schema_id], "id": "1"}
+    registry = SchemaRegistry(core_schemas.schema, result_cache_size=2)
+
+    registry.validate(examples.user)
+    registry.validate(dict(examples.user))
+    assert registry.result_cache_info() == (1, 1, 2, 1)
+
+    for _ in range(2):
+        with pytest.raises(AssertionError, match="userName"):
+            registry.validate(invalid_user)
+    with pytest.raises(AssertionError, match="userName"):
+        registry.validate(invalid_user, max_errors=1)
+    assert registry.result_cache_info() == (2, 3, 2, 2)
+
+    # the least recently used result (examples.user) was evicted
+    registry.validate(examples.user)
+    assert registry.result_cache_info() == (2, 4, 2, 2)
+
+    registry.register(core_schemas.schema[user_schema_id], core=True)
+    assert registry.result_cache_info().currsize == 0
+
+
+def test_validate_result_cache_is_detached_from_the_payload():
+    registry = SchemaRegistry(core_schemas.schema, result_cache_size=2)
+    invalid_user = {"schemas": [user_schema_id], "userName": "bjensen", "name": ["x"]}
+
+    with pytest.raises(AssertionError) as excinfo:
+        registry.validate(invalid_user)
+    message = str(excinfo.value)
+    assert "['x']" in message
+
+    invalid_user["name"].append("changed")
+    errors = []
+    for _ in range(2):
+        with pytest.raises(AssertionError) as excinfo:
+            registry.validate(
+                {"schemas": [user_schema_id], "userName": "bjensen", "name": ["x"]}
+            )
+        errors.append(excinfo.value)
+    assert registry.result_cache_info().hits == 2
+    assert [str(error) for error in errors] == [message, message]
+    assert errors[0] is not errors[1]
+
+
+def test_validate_result_cache_skips_payloads_that_cannot_be_pickled():
+    from . import examples
+
+    registry = SchemaRegistry(core_schemas.schema, result_cache_size=2)
+    registry.validate(dict(examples.user, notPicklable=lambda: None))
+    assert registry.result_cache_info() == (0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        SchemaRegistry(core_schemas.schema, result_cache_size=-1)
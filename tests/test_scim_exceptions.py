@@ -0,0 +1,83 @@
+from scimschema._model import scim_exceptions
+
+
+def test_exception_message_is_rendered_from_fields():
+    d = {"emails": [{"value": "bjensen@example.com"}]}
+    exception = scim_exceptions.ScimAttributeValueNotFoundException(
+        d=d,
+        locator=["urn:test", "userName"],
+        attribute_name="userName",
+        multi_value=False,
+    )
+
+    assert exception.attribute_name == "userName"
+    message = (
+        "'Single-value attribute:userName' is required at the following location "
+        "'['urn:test', 'userName']' but found '{'emails'}'"
+    )
+    assert str(exception) == message
+
+    # the message only depends on the keys found, which are not changed along with d
+    d["emails"].clear()
+    d["name"] = {}
+    assert str(exception) == message
+    assert not hasattr(exception, "d")
+
+
+def test_aggregated_exception_message():
+    exception = scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+        location="Scim response",
+        exceptions=[
+            scim_exceptions.ScimAttributeInvalidTypeException(
+                expected={},
+                locator=["urn:test", "active"],
+                value="yes",
+                multi_value=False,
+                attribute_type="boolean",
+            )
+        ],
+    )
+
+    assert str(exception) == (
+        "Found 1 aggregated exceptions at Scim response: \n "
+        "ScimAttributeInvalidTypeException: \n \t "
+        "'Single-value attribute: 'yes' (at path: urn:test/active) "
+        "is expected to be 'boolean' (see: {} None)"
+    )
+    assert repr(exception) == "{}({!r})".format(
+        "AggregatedScimMultValueAttributeValidationExceptions", str(exception)
+    )
+
+
+def test_get_errors_flattens_aggregated_exceptions():
+    exception = scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+        location="Scim response",
+        exceptions=[
+            scim_exceptions.AggregatedScimMultValueAttributeValidationExceptions(
+                location="emails",
+                exceptions=[
+                    scim_exceptions.ScimAttributeDuplicateValueException(
+                        locator=["urn:test", "emails"], value=["a@example.com"]
+                    ),
+                    ValueError("not a number"),
+                ],
+            ),
+            scim_exceptions.ScimAttributeValueNotFoundException(
+                d={},
+                locator=["urn:test", "userName"],
+                attribute_name="userName",
+                multi_value=False,
+            ),
+        ],
+    )
+
+    errors = scim_exceptions.get_errors(exception)
+
+    assert [(e.path, e.code) for e in errors] == [
+        (("urn:test", "emails"), "duplicate"),
+        ((), "invalidValue"),
+        (("urn:test", "userName"), "required"),
+    ]
+    assert errors[0].scim_type == "uniqueness"
+    assert errors[0].actual == ["a@example.com"]
+    assert str(errors[2]).startswith("required at path urn:test/userName")
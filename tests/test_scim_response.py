@@ -1,5 +1,6 @@
 import json
 import re
+from copy import deepcopy
 
 import pytest
 
@@ -45,6 +46,19 @@ def test_validating_example_custom_user():
     ).validate()
 
 
+def test_validating_does_not_mutate_data():
+    from . import examples
+
+    data = deepcopy(examples.customUser)
+    ScimResponse(
+        data=data,
+        core_schema_definitions=core_schemas.schema,
+        extension_schema_definitions=extension.schema,
+    ).validate()
+    core_schemas.schema["urn:ietf:params:scim:schemas:core:2.0:User"].validate(data)
+    assert data == examples.customUser
+
+
 def test_validating_invalid_example_user():
     user_example_without_username_property = {
         "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
@@ -67,6 +81,19 @@ def test_validating_invalid_example_user():
     assert re.search(pattern_invalid_str, str(assert_error))
 
 
+def test_errors_of_invalid_example_user():
+    scim_response = ScimResponse(
+        data={"schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"]},
+        core_schema_definitions=core_schemas.schema,
+        extension_schema_definitions=extension.schema,
+    )
+    errors = scim_response.errors()
+
+    assert len(errors) == 1
+    assert errors[0].path == ("urn:ietf:params:scim:schemas:core:2.0:User", "userName")
+    assert errors[0].code == "required"
+
+
 def test_validating_valid_example_account():
     account_examples = {
         "schemas": [
@@ -1,6 +1,8 @@
 import re
 
-from scimschema import validate
+import pytest
+
+from scimschema import get_errors, validate, validate_many
 
 from . import extension
 
@@ -36,3 +38,184 @@ def test_validate_invalid_response():
 # >>>    E    ScimAttributeValueNotFoundException:
 # >>>    E    	 'Single-value attribute:ipRestrictionsEnabled' is required at the following location '['urn:huddle:params:scim:schemas:extension:2.0:Account', 'ipRestrictionsEnabled']' but found '{}'
 # >>>    !!!!!!!!!!!!!!!!!!! Interrupted: 1 errors during collection !!!!!!!!!!!!!!!!!!!
+
+
+def test_validate_many():
+    from . import examples
+
+    invalid_user = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "id": "2819c223-7f76-453a-919d-413861904646",
+    }
+    results = validate_many(
+        resources=[
+            examples.user,
+            invalid_user,
+            examples.group,
+            {"schemas": []},
+            examples.user,
+        ],
+        extension_schema_definitions=extension.schema,
+    )
+
+    assert len(results) == 5
+    assert results[0] is None and results[2] is None and results[4] is None
+    assert "'Single-value attribute:userName' is required" in str(results[1])
+    assert "Response has no specified schema" in str(results[3])
+
+
+def test_validate_many_unknown_schema():
+    results = validate_many(
+        resources=[{"schemas": ["urn:ietf:params:scim:schemas:unknown"]}],
+        extension_schema_definitions=extension.schema,
+    )
+    assert "Response has unknown schema" in str(results[0])
+
+
+@pytest.mark.parametrize(
+    "schemas", [5, "urn:ietf:params:scim:schemas:core:2.0:User", [{"a": 1}], [["x"]]]
+)
+def test_validate_many_malformed_schemas(schemas):
+    from . import examples
+
+    results = validate_many(
+        resources=[{"schemas": schemas, "userName": "bjensen"}, examples.user],
+        extension_schema_definitions=extension.schema,
+    )
+    assert "Response schemas must be a list of strings" in str(results[0])
+    assert results[1] is None
+
+
+@pytest.mark.parametrize("value", ["x", 5, [{"ipRestrictionsEnabled": True}], None])
+def test_validate_many_extension_is_not_an_object(value):
+    from . import examples
+
+    account_schema_id = "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount"
+    user = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User", account_schema_id],
+        "userName": "bjensen",
+        account_schema_id: value,
+    }
+    results = validate_many(
+        resources=[user, examples.user],
+        extension_schema_definitions=extension.schema,
+    )
+    assert [(e.path, e.code) for e in get_errors(user, extension.schema)] == [
+        ((account_schema_id,), "invalidType")
+    ]
+    assert "is expected to be 'complex'" in str(results[0])
+    assert results[1] is None
+
+
+def test_validate_many_invalid_decimal():
+    from scimschema._model.model import Model
+
+    from . import examples
+
+    score_schema_id = "urn:test:schemas:extension:Score"
+    score_model = Model(
+        {
+            "id": score_schema_id,
+            "name": "Score",
+            "attributes": [{"name": "score", "type": "decimal"}],
+        }
+    )
+    user = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User", score_schema_id],
+        "userName": "bjensen",
+        score_schema_id: {"score": 10},
+    }
+    results = validate_many(
+        resources=[user, examples.user],
+        extension_schema_definitions={score_schema_id: score_model},
+    )
+    assert "must be a real number" in str(results[0])
+    assert results[1] is None
+
+
+def test_get_errors():
+    from . import examples
+
+    assert get_errors(data=examples.user, extension_schema_definitions={}) == []
+
+    content = {
+        "schemas": [
+            "urn:ietf:params:scim:schemas:core:2.0:User",
+            "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount",
+        ],
+        "userName": 12,
+        "emails": [{"value": "bjensen@example.com", "type": "unknown"}],
+        "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount": {},
+    }
+    errors = get_errors(data=content, extension_schema_definitions=extension.schema)
+
+    assert [(e.path, e.code, e.scim_type) for e in errors] == [
+        (
+            (
+                "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount",
+                "ipRestrictionsEnabled",
+            ),
+            "required",
+            "invalidValue",
+        ),
+        (
+            ("urn:ietf:params:scim:schemas:core:2.0:User", "userName"),
+            "invalidType",
+            "invalidValue",
+        ),
+        (
+            ("urn:ietf:params:scim:schemas:core:2.0:User", "emails", "type"),
+            "invalidType",
+            "invalidValue",
+        ),
+    ]
+    assert errors[1].actual == "(int)12"
+
+
+def test_get_errors_of_each_attribute():
+    content = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "userName": 1,
+        "displayName": 2,
+        "active": "yes",
+        "emails": [{"value": 1}],
+    }
+    errors = get_errors(data=content, extension_schema_definitions={})
+
+    assert [e.path[1:] for e in errors] == [
+        ("userName",),
+        ("displayName",),
+        ("active",),
+        ("emails", "value"),
+    ]
+
+    errors = get_errors(data=content, extension_schema_definitions={}, max_errors=2)
+    assert [e.path[1:] for e in errors] == [("userName",), ("displayName",)]
+
+
+@pytest.mark.parametrize("max_errors, expected_count", [(1, 1), (3, 3), (None, 10)])
+def test_validate_max_errors(max_errors, expected_count):
+    content = {
+        "schemas": [
+            "urn:ietf:params:scim:schemas:core:2.0:Group",
+            "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount",
+        ],
+        "members": [{"value": i, "type": "User"} for i in range(9)],
+        "urn:huddle:params:scim:schemas:extension:2.0:SimpleAccount": {},
+    }
+
+    errors = get_errors(
+        data=content,
+        extension_schema_definitions=extension.schema,
+        max_errors=max_errors,
+    )
+    assert len(errors) == expected_count
+    assert errors[0].code == "required"
+    assert all(e.code == "invalidType" for e in errors[1:])
+
+    with pytest.raises(AssertionError):
+        validate(
+            data=content,
+            extension_schema_definitions=extension.schema,
+            max_errors=max_errors,
+        )
@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+
+from scimschema import validate_stream
+from scimschema._model.stream import iter_list_response_resources
+
+from . import extension
+
+invalid_user = {
+    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+    "id": "2819c223-7f76-453a-919d-413861904646",
+}
+
+
+def _list_response(resources):
+    return {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": len(resources),
+        "Resources": resources,
+        "startIndex": 1,
+        "itemsPerPage": 12345,
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_list_response_resources(chunk_size):
+    from . import examples
+
+    resources = [examples.user, examples.group, invalid_user]
+    content = json.dumps(_list_response(resources), indent=2)
+
+    streamed = list(
+        iter_list_response_resources(io.StringIO(content), chunk_size=chunk_size)
+    )
+    assert streamed == resources
+
+    streamed_bytes = list(
+        iter_list_response_resources(
+            io.BytesIO(content.encode("utf-8")), chunk_size=chunk_size
+        )
+    )
+    assert streamed_bytes == resources
+
+
+@pytest.mark.parametrize(
+    "content", ['{"totalResults": 0, "Resources": []}', "{}", '{"totalResults": 0}']
+)
+def test_iter_list_response_without_resources(content):
+    assert list(iter_list_response_resources(io.StringIO(content))) == []
+
+
+def test_iter_list_response_invalid_json():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_list_response_resources(io.StringIO('{"Resources": [{}, }')))
+
+
+def test_validate_stream():
+    from . import examples
+
+    content = json.dumps(_list_response([examples.user, invalid_user]))
+    results = list(
+        validate_stream(
+            io.StringIO(content), extension_schema_definitions=extension.schema
+        )
+    )
+
+    assert [resource for resource, _ in results] == [examples.user, invalid_user]
+    assert results[0][1] is None
+    assert "'Single-value attribute:userName' is required" in str(results[1][1])
+
+
+def test_validate_ndjson_stream():
+    from . import examples
+
+    content = "\n".join(json.dumps(r) for r in [examples.group, invalid_user]) + "\n\n"
+    results = list(
+        validate_stream(
+            io.StringIO(content),
+            extension_schema_definitions=extension.schema,
+            ndjson=True,
+        )
+    )
+
+    assert len(results) == 2
+    assert results[0] == (examples.group, None)
+    assert results[1][1] is not None
+
+
+def test_validate_ndjson_stream_invalid_line():
+    from . import examples
+
+    content = "\n".join([json.dumps(examples.group), "{bad", json.dumps(examples.user)])
+    results = list(
+        validate_stream(
+            io.StringIO(content),
+            extension_schema_definitions=extension.schema,
+            ndjson=True,
+        )
+    )
+
+    assert len(results) == 3
+    assert results[0] == (examples.group, None)
+    assert results[1][0] == "{bad"
+    assert str(results[1][1]).startswith("line 2 is not valid JSON: ")
+    assert results[2] == (examples.user, None)
@@ -0,0 +1,55 @@
+import io
+import json
+
+from scimschema import UniquenessIndex, validate_many, validate_stream
+from scimschema._model import scim_exceptions
+
+from . import examples
+
+user_schema_id = "urn:ietf:params:scim:schemas:core:2.0:User"
+
+
+def get_user(id, user_name):
+    return {"schemas": [user_schema_id], "id": id, "userName": user_name}
+
+
+def test_validate_many_checks_uniqueness():
+    index = UniquenessIndex()
+    results = validate_many(
+        [get_user("1", "bjensen"), get_user("2", "BJensen"), get_user("1", "jsmith")],
+        extension_schema_definitions={},
+        uniqueness_index=index,
+    )
+    assert results[0] is None
+    assert [(e.path, e.code, e.scim_type) for e in results[1].errors()] == [
+        ((user_schema_id, "userName"), "duplicate", "uniqueness")
+    ]
+    assert "already used by resource '1'" in str(results[1])
+    assert [e.path for e in results[2].errors()] == [("id",)]
+
+    # a later batch is checked against the resources of the previous ones
+    results = validate_many(
+        [get_user("4", "bjensen"), get_user("5", "other")],
+        extension_schema_definitions={},
+        uniqueness_index=index,
+    )
+    assert [result is None for result in results] == [False, True]
+    assert len(index) == 5
+
+
+def test_validate_stream_checks_uniqueness():
+    invalid_user = {"schemas": [user_schema_id], "id": "3"}
+    lines = [examples.user, invalid_user, dict(examples.user, id="4")]
+    fp = io.StringIO("\n".join(json.dumps(line) for line in lines))
+
+    results = list(
+        validate_stream(
+            fp,
+            extension_schema_definitions={},
+            ndjson=True,
+            uniqueness_index=UniquenessIndex(),
+        )
+    )
+    assert results[0][1] is None
+    assert [e.code for e in scim_exceptions.get_errors(results[1][1])] == ["required"]
+    assert [e.code for e in scim_exceptions.get_errors(results[2][1])] == ["duplicate"]